@@ -42,11 +42,13 @@ except ImportError:
     except ImportError:
         IntegratedTranslatorGUI = None
 
+# Explicit import instead of a star-import: binding one name skips the
+# per-name dict merge of everything constants defines on every cold start
 try:
-    from .constants import *
+    from .constants import PROGRAMMING_LANGUAGES
 except ImportError:
     try:
-        from constants import *
+        from constants import PROGRAMMING_LANGUAGES
     except ImportError:
         # Fallback constants
         PROGRAMMING_LANGUAGES = ["Python", "JavaScript", "Java", "C++", "C#", "PHP", "Ruby", "Go", "Rust", "TypeScript"]
@@ -90,59 +92,35 @@ except ImportError:
             def cleanup_resources(self):
                 pass
 
-# Import tab components with safe fallbacks
-try:
-    from .translator_tab import TranslatorTab
-except ImportError:
-    try:
-        from translator_tab import TranslatorTab
-    except ImportError:
-        TranslatorTab = None
+# Export main classes - built inline with the imports below so names that
+# failed to import are never exported, without a second globals() rescan
+__all__ = ['ErrorHandler', 'ConfigManager', 'ResourceManager']
 
-try:
-    from .chatbot_tab import ChatbotTab
-except ImportError:
-    try:
-        from chatbot_tab import ChatbotTab
-    except ImportError:
-        ChatbotTab = None
+if IntegratedTranslatorGUI is not None:
+    __all__.insert(0, 'IntegratedTranslatorGUI')
 
-try:
-    from .security_tab import SecurityTab
-except ImportError:
-    try:
-        from security_tab import SecurityTab
-    except ImportError:
-        SecurityTab = None
-
-try:
-    from .lyric_lab_tab import LyricLabTab
-except ImportError:
-    try:
-        from lyric_lab_tab import LyricLabTab
-    except ImportError:
-        LyricLabTab = None
+# Tab components resolve lazily (PEP 562): importing gui_modules no
+# longer pulls every tab's transitive AI/audio dependencies up front
+_TAB_COMPONENTS = {
+    'TranslatorTab': 'translator_tab',
+    'ChatbotTab': 'chatbot_tab',
+    'SecurityTab': 'security_tab',
+    'LyricLabTab': 'lyric_lab_tab',
+    'MenuHandlers': 'menu_handlers',
+}
 
-try:
-    from .menu_handlers import MenuHandlers
-except ImportError:
-    try:
-        from menu_handlers import MenuHandlers
-    except ImportError:
-        MenuHandlers = None
+__all__.extend(_TAB_COMPONENTS)
 
-# Export main classes
-__all__ = [
-    'IntegratedTranslatorGUI',
-    'TranslatorTab',
-    'ChatbotTab', 
-    'SecurityTab',
-    'LyricLabTab',
-    'MenuHandlers',
-    'ErrorHandler',
-    'ConfigManager',
-    'ResourceManager'
-]
 
-# Remove None values from __all__
-__all__ = [item for item in __all__ if globals().get(item) is not None]
\ No newline at end of file
+def __getattr__(name):
+    """Resolve tab modules and classes on first access (PEP 562)."""
+    if name in _TAB_COMPONENTS:
+        _module = safe_import(_TAB_COMPONENTS[name])
+        value = getattr(_module, name, None) if _module else None
+    elif name in _TAB_COMPONENTS.values():
+        value = safe_import(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache so later accesses are plain module-dict lookups
+    globals()[name] = value
+    return value
@@ -7,17 +7,51 @@ Provides professional audio processing capabilities including:
 """
 import sys
 import os
+import threading
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import functools
+
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
+
+
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _norm_inplace(a, target):
+        """Fused max-abs + in-place rescale - one memory pass, no abs buffer."""
+        m = 0.0
+        for i in prange(a.size):
+            m = max(m, abs(a[i]))
+        if m > 0:
+            s = target / m
+            for i in prange(a.size):
+                a[i] *= s
+        return m
+except ImportError:
+    _norm_inplace = None
+
+
+@functools.lru_cache(maxsize=16)
+def _fade_ramp(n, up):
+    """Return a cached float32 fade ramp of length n (rising or falling)."""
+    ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+    return ramp if up else ramp[::-1]
+
+
 class AudioTools:
    
     """Main Audio Tools class that provides audio processing capabilities."""
     
+    # Playback ring buffer geometry (single producer, single consumer)
+    _SEG_FRAMES = 2048
+    _RING_SEGS = 8
+    
     def __init__(self, parent):
         """Initialize Audio Tools with parent window reference."""
         self.parent = parent
@@ -26,6 +60,20 @@ class AudioTools:
         self.audio_stream = None
         self.is_playing = False
         self.volume = 0.8
+        self.window = None
+        self.playback_position = 0
+        self._wf_cache = None  # last (audio_data, width, reduced samples)
+        self._int_scale = 1.0  # PCM -> [-1, 1] factor for memory-mapped ints
+        # SPSC ring buffer: a producer thread reads ahead from audio_data,
+        # the real-time callback only drains preallocated segments
+        self._ring = None
+        self._ring_read = 0
+        self._ring_write = 0
+        self._producer = None
+        self._producer_stop = None
+        self._producer_done = False
+        self._frames_played = 0  # written by the callback, read by the UI
+        self._progress_active = False  # whether the progress pump is running
     
     # Add this method to your AudioTools class in audio_tools.py
     def show_audio_tools(self):
@@ -36,8 +84,13 @@ class AudioTools:
             self.window.title("🎧 CodedSwitch Audio Tools")
             self.window.geometry("900x700")
         
-        # Store reference to status var if available
-            self.status_var = getattr(self.parent.gui, 'status_var', tk.StringVar())
+        # Local var drives this window's status label; mirror writes to
+        # the main window's status bar when the GUI exposes set_status
+            self.status_var = tk.StringVar()
+            set_status = getattr(self.parent.gui, 'set_status', None)
+            if set_status is not None:
+                self.status_var.trace_add(
+                    'write', lambda *_: set_status(self.status_var.get()))
         
         # Setup the complete UI
             self.setup_ui()
@@ -45,6 +98,9 @@ class AudioTools:
         # Window close protocol
             self.window.protocol("WM_DELETE_WINDOW", self.on_close)
         
+        # Resume deferred redraws/progress when the window reappears
+            self.window.bind('<Map>', self._on_window_mapped)
+        
             logger.info("Audio Tools window opened successfully")
         
         except Exception as e:
@@ -117,6 +173,9 @@ class AudioTools:
         
         self.canvas = tk.Canvas(frame, bg='white', height=150)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Canvas item ids reused across redraws (fresh canvas, fresh items)
+        self._wave_id = None
+        self._center_id = None
     
     def _create_tool_buttons(self, parent):
         """Create audio processing tool buttons."""
@@ -178,12 +237,95 @@ class AudioTools:
             # Stop any current playback
             self._stop_playback()
             
-            # Load audio file
-            self.audio_data, self.sample_rate = sf.read(file_path)
+            # Header-only probe: duration and sample rate come from the file
+            # header, so the info label fills in before any samples are read
+            try:
+                info = sf.info(file_path)
+                self.audio_info.config(
+                    text=f"Duration: {info.duration:.2f}s | "
+                         f"Sample Rate: {info.samplerate}Hz | {info.channels}ch"
+                )
+                self.window.update_idletasks()
+            except Exception:
+                pass
+            
+            # Load audio file - WAVs are memory-mapped so load time and
+            # resident memory stay proportional to what is actually touched;
+            # other formats still go through soundfile
+            self._int_scale = 1.0
+            loaded = False
+            if os.path.splitext(file_path)[1].lower() == '.wav':
+                try:
+                    from scipy.io import wavfile
+                    self.sample_rate, self.audio_data = wavfile.read(file_path, mmap=True)
+                    dtype = self.audio_data.dtype
+                    if np.issubdtype(dtype, np.signedinteger):
+                        # PCM stays integer until an edit copies it; playback
+                        # scales on the fly
+                        self._int_scale = 1.0 / float(np.iinfo(dtype).max)
+                        loaded = True
+                    elif np.issubdtype(dtype, np.unsignedinteger):
+                        # u8 PCM sits on a midpoint offset that a plain
+                        # scale factor can't remove; soundfile handles it
+                        self.audio_data = None
+                    else:
+                        loaded = True
+                except Exception:
+                    pass
+            if not loaded:
+                # Read the samples on a background thread so the Tk loop
+                # stays responsive on multi-GB files; the worker posts the
+                # finished buffer back via after(0)
+                self.status_var.set(f"Loading: {os.path.basename(file_path)}...")
+                threading.Thread(target=self._read_audio_worker,
+                                 args=(file_path,), daemon=True).start()
+                return
+            
+            self._finish_load(file_path)
             
-            # Convert to mono if stereo
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load audio: {e}")
+    
+    def _read_audio_worker(self, file_path):
+        """Stream samples into a preallocated buffer off the Tk thread."""
+        try:
+            # Bounded blocks (~30 s at a time) into one preallocated buffer
+            # instead of handing sf.read the whole file at once
+            with sf.SoundFile(file_path) as f:
+                samplerate = f.samplerate
+                buf = np.empty((f.frames, f.channels), dtype=np.float32)
+                pos = 0
+                for block in f.blocks(blocksize=f.samplerate * 30,
+                                      dtype='float32', always_2d=True):
+                    buf[pos:pos + len(block)] = block
+                    pos += len(block)
+            data = buf[:, 0] if buf.shape[1] == 1 else buf
+            self.window.after(0, self._on_audio_read, file_path, data, samplerate)
+        except Exception as e:
+            self.window.after(
+                0, messagebox.showerror, "Error", f"Failed to load audio: {e}")
+    
+    def _on_audio_read(self, file_path, data, samplerate):
+        """Install freshly read samples back on the Tk thread."""
+        self.audio_data = data
+        self.sample_rate = samplerate
+        self._finish_load(file_path)
+    
+    def _finish_load(self, file_path):
+        """Shared post-load path: downmix, refresh labels and waveform."""
+        try:
+            # Convert to mono if stereo - an explicit float32 add into a
+            # preallocated buffer halves the bandwidth of np.mean's default
+            # float64 and keeps playback zero-copy into the float32 stream
             if len(self.audio_data.shape) > 1:
-                self.audio_data = np.mean(self.audio_data, axis=1)
+                data = self.audio_data
+                mono = np.empty(len(data), dtype=np.float32)
+                np.add(data[:, 0], data[:, 1], out=mono)
+                for ch in range(2, data.shape[1]):
+                    mono += data[:, ch]
+                mono *= 1.0 / data.shape[1]
+                self.audio_data = mono
+            self._wf_cache = None
             
             # Update UI
             duration = len(self.audio_data) / self.sample_rate
@@ -194,45 +336,91 @@ class AudioTools:
             
             # Draw waveform
             self._draw_waveform()
-            self.status_var.set(f"Loaded: {file_path.split('/')[-1]}")
+            self.status_var.set(f"Loaded: {os.path.basename(file_path)}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load audio: {e}")
     
+    def _on_window_mapped(self, event=None):
+        """Catch up on work deferred while the window was not viewable."""
+        if event is not None and event.widget is not self.window:
+            return
+        self._draw_waveform()
+        if self.is_playing and not self._progress_active:
+            self._update_progress()
+    
     def _draw_waveform(self):
         """Draw the audio waveform on the canvas."""
         if self.audio_data is None:
             return
+        
+        # No point walking the buffer for an invisible canvas; the <Map>
+        # binding redraws once the window is back
+        if not self.window.winfo_viewable():
+            return
             
-        self.canvas.delete("all")
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
         
         if width <= 1 or height <= 1:
             return
         
-        # Downsample for display
-        num_samples = min(1000, len(self.audio_data))
-        step = max(1, len(self.audio_data) // num_samples)
-        samples = self.audio_data[::step]
-        
-        # Normalize
-        max_sample = max(abs(samples.max()), abs(samples.min()))
-        if max_sample > 0:
-            samples = samples / max_sample
+        # Reuse the last reduced waveform when neither the audio nor the
+        # canvas width changed - repaints on resize/playback then cost
+        # O(width) instead of re-walking the whole buffer
+        cache = self._wf_cache
+        if cache is not None and cache[0] is self.audio_data and cache[1] == width:
+            samples = cache[2]
+        else:
+            # Downsample for display with a MinMax reduction: one min and one
+            # max per pixel bucket keeps the true envelope instead of dropping
+            # peaks between strides like plain [::step] decimation does
+            data = self.audio_data
+            n_buckets = min(width, len(data))
+            if n_buckets == 0:
+                return
+            bucket_len = len(data) // n_buckets
+            buckets = data[:n_buckets * bucket_len].reshape(n_buckets, bucket_len)
+            mins = buckets.min(axis=1)
+            maxs = buckets.max(axis=1)
+            # Interleave so the polyline sweeps through min and max per bucket
+            samples = np.empty(2 * n_buckets, dtype=data.dtype)
+            samples[0::2] = mins
+            samples[1::2] = maxs
+
+            # Normalize
+            max_sample = max(abs(samples.max()), abs(samples.min()))
+            if max_sample > 0:
+                samples = samples / max_sample
+
+            self._wf_cache = (self.audio_data, width, samples)
         
-        # Draw center line
+        # Draw center line - updating coordinates on the existing item is
+        # one Tcl call, where delete("all") + create rebuilds every item
         center = height // 2
-        self.canvas.create_line(0, center, width, center, fill="lightgray")
+        if self._center_id is None:
+            self._center_id = self.canvas.create_line(0, center, width, center,
+                                                      fill="lightgray")
+        else:
+            self.canvas.coords(self._center_id, 0, center, width, center)
         
-        # Draw waveform
+        # Draw waveform as a single polyline - one Tcl call instead of one
+        # create_line per sample
+        if len(samples) < 2:
+            return
         x_scale = width / len(samples)
-        for i in range(1, len(samples)):
-            x1 = (i-1) * x_scale
-            x2 = i * x_scale
-            y1 = center - int(samples[i-1] * (center - 5))
-            y2 = center - int(samples[i] * (center - 5))
-            self.canvas.create_line(x1, y1, x2, y2, fill="blue", width=1)
+        # int16 is plenty for pixel coordinates and halves the bytes moved
+        # when the array is materialized into the Tcl command
+        xs = (np.arange(len(samples)) * x_scale).astype(np.int16)
+        ys = (center - samples * (center - 5)).astype(np.int16)
+        pts = np.empty(2 * len(samples), dtype=np.int16)
+        pts[0::2] = xs
+        pts[1::2] = ys
+        if self._wave_id is None:
+            self._wave_id = self.canvas.create_line(*pts.tolist(),
+                                                    fill="blue", width=1)
+        else:
+            self.canvas.coords(self._wave_id, *pts.tolist())
     
     def _toggle_playback(self):
         """Toggle audio playback."""
@@ -248,15 +436,32 @@ class AudioTools:
     def _start_playback(self):
         """Start audio playback."""
         try:
-            if not hasattr(self, 'audio_stream') or self.audio_stream is None:
+            if self.audio_stream is None:
+                self.playback_position = 0
+                self._frames_played = 0
+                self._ring = np.empty((self._RING_SEGS, self._SEG_FRAMES),
+                                      dtype=np.float32)
+                self._ring_read = 0
+                self._ring_write = 0
+                self._producer_stop = threading.Event()
+                self._producer_done = False
                 self.audio_stream = sd.OutputStream(
                     samplerate=self.sample_rate,
+                    blocksize=self._SEG_FRAMES,
                     channels=1,
                     dtype='float32',
                     callback=self._audio_callback
                 )
-                self.playback_position = 0
-                
+                self._producer = threading.Thread(target=self._fill_ring,
+                                                  daemon=True)
+                self._producer.start()
+                # Prime the ring before the stream starts so the very first
+                # callback finds valid audio instead of underrunning while
+                # the producer races to fill the buffer
+                while (self._ring_write - self._ring_read < 2
+                       and not self._producer_done):
+                    self._producer_stop.wait(0.001)
+
             self.audio_stream.start()
             self.is_playing = True
             self.status_var.set("Playing...")
@@ -267,17 +472,23 @@ class AudioTools:
     
     def _pause_playback(self):
         """Pause audio playback."""
-        if hasattr(self, 'audio_stream') and self.audio_stream is not None:
+        if self.audio_stream is not None:
             self.audio_stream.stop()
             self.is_playing = False
             self.status_var.set("Paused")
     
     def _stop_playback(self):
         """Stop audio playback and reset position."""
-        if hasattr(self, 'audio_stream') and self.audio_stream is not None:
+        if self.audio_stream is not None:
+            if self._producer_stop is not None:
+                self._producer_stop.set()
             self.audio_stream.stop()
             self.audio_stream.close()
             self.audio_stream = None
+            if self._producer is not None:
+                self._producer.join(timeout=1.0)
+                self._producer = None
+            self._ring = None
             self.playback_position = 0
             self.progress_var.set(0)
             self.is_playing = False
@@ -289,62 +500,83 @@ class AudioTools:
     
     def _update_progress(self):
         """Update the progress bar during playback."""
-        if hasattr(self, 'audio_stream') and self.audio_stream is not None and self.is_playing:
-            if hasattr(self, 'playback_position') and hasattr(self, 'audio_data'):
-                progress = (self.playback_position / len(self.audio_data)) * 100
+        if (self.audio_stream is not None and self.is_playing
+                and self.window.winfo_viewable()):
+            if self.audio_data is not None and len(self.audio_data):
+                progress = min(100.0,
+                               100.0 * self._frames_played / len(self.audio_data))
                 self.progress_var.set(progress)
-                
-                # Schedule next update
-                self.window.after(100, self._update_progress)
+            
+            # Schedule next update
+            self._progress_active = True
+            self.window.after(100, self._update_progress)
+        else:
+            # Pump stops while hidden/stopped; <Map> restarts it
+            self._progress_active = False
+    
+    def _fill_ring(self):
+        """Producer side of the playback ring: read ahead from audio_data.
+
+        Runs on its own thread so the real-time callback never touches the
+        (possibly memory-mapped) audio buffer directly.
+        """
+        data = self.audio_data
+        scale = self._int_scale
+        n = len(data)
+        pos = self.playback_position
+        while not self._producer_stop.is_set() and pos < n:
+            if self._ring_write - self._ring_read >= self._RING_SEGS:
+                # Ring full - wait for the callback to drain a segment
+                self._producer_stop.wait(0.005)
+                continue
+            seg = self._ring[self._ring_write % self._RING_SEGS]
+            chunk = data[pos:pos + self._SEG_FRAMES]
+            np.multiply(chunk, scale, out=seg[:len(chunk)])
+            seg[len(chunk):] = 0.0
+            pos += len(chunk)
+            self._ring_write += 1
+        self._producer_done = True
     
     def _audio_callback(self, outdata, frames, time, status):
-        """Audio callback for playback."""
+        """Audio callback for playback - consumer side of the ring."""
         if status:
             print(status, file=sys.stderr)
             
-        if not hasattr(self, 'playback_position'):
-            self.playback_position = 0
-            
-        if self.audio_data is None:
+        ring = self._ring
+        if ring is None or self._ring_read >= self._ring_write:
             outdata.fill(0)
+            if ring is None or self._producer_done:
+                # End of audio - finish up on the Tk thread, not here
+                self.window.after(0, self._stop_playback)
             return
             
-        # Calculate remaining samples
-        remaining = len(self.audio_data) - self.playback_position
-        
-        if remaining == 0:
-            # End of audio
-            self._stop_playback()
-            outdata.fill(0)
-            return
-            
-        # Get the next chunk of audio
-        chunk_size = min(frames, remaining)
-        chunk = self.audio_data[self.playback_position:self.playback_position + chunk_size]
-        
-        # Apply volume
-        chunk = chunk * self.volume
-        
-        # Handle stereo output if needed
-        if len(chunk.shape) == 1 and outdata.shape[1] > 1:
-            outdata[:, 0] = chunk
-            for i in range(1, outdata.shape[1]):
-                outdata[:, i] = chunk
-        else:
-            outdata[:chunk_size] = chunk.reshape(-1, 1)
-        
-        # Zero-fill if needed
-        if chunk_size < frames:
-            outdata[chunk_size:] = 0
-        
-        # Update position
-        self.playback_position += chunk_size
+        # Apply volume writing straight into sounddevice's preallocated
+        # buffer - no per-callback allocation on the real-time thread
+        seg = ring[self._ring_read % self._RING_SEGS]
+        np.multiply(seg[:frames], self.volume, out=outdata[:, 0])
+        if outdata.shape[1] > 1:
+            outdata[:, 1:] = outdata[:, 0:1]
+        self._ring_read += 1
+        
+        # A plain int increment is the only state the callback publishes;
+        # the progress pump on the Tk thread derives the position from it
+        self._frames_played += frames
     
     # ===== Audio Processing Methods =====
     
+    def _ensure_writable(self):
+        """Copy memory-mapped (read-only) audio lazily before in-place edits."""
+        if (isinstance(self.audio_data, np.memmap)
+                or not self.audio_data.flags.writeable
+                or np.issubdtype(self.audio_data.dtype, np.integer)):
+            self.audio_data = self.audio_data.astype(np.float32)
+        if self._int_scale != 1.0:
+            self.audio_data *= self._int_scale
+            self._int_scale = 1.0
+    
     def _trim_audio(self):
         """Trim the start and end of the audio."""
-        if not hasattr(self, 'window') or not self.window.winfo_exists():
+        if self.window is None or not self.window.winfo_exists():
             return
             
         # Create trim dialog
@@ -379,6 +611,7 @@ class AudioTools:
                 
                 # Trim the audio
                 self.audio_data = self.audio_data[start_sample:end_sample]
+                self._wf_cache = None
                 
                 # Update UI
                 self._draw_waveform()
@@ -395,12 +628,19 @@ class AudioTools:
     def _normalize_audio(self):
         """Normalize audio to maximum level."""
         try:
-            # Find maximum absolute value
-            max_val = np.max(np.abs(self.audio_data))
+            self._ensure_writable()
+            if _norm_inplace is not None:
+                # Normalize to 0.9 to avoid potential clipping
+                max_val = _norm_inplace(self.audio_data, 0.9)
+            else:
+                # Fallback: two passes plus an abs temporary, but still
+                # rescaling in place
+                max_val = np.max(np.abs(self.audio_data))
+                if max_val > 0:
+                    np.multiply(self.audio_data, 0.9 / max_val, out=self.audio_data)
             
             if max_val > 0:
-                # Normalize to 0.9 to avoid potential clipping
-                self.audio_data = (self.audio_data / max_val) * 0.9
+                self._wf_cache = None
                 
                 # Update UI
                 self._draw_waveform()
@@ -411,7 +651,7 @@ class AudioTools:
     
     def _fade_audio(self):
         """Apply fade in/out to audio."""
-        if not hasattr(self, 'window') or not self.window.winfo_exists():
+        if self.window is None or not self.window.winfo_exists():
             return
             
         # Create fade dialog
@@ -433,18 +673,22 @@ class AudioTools:
         
         def apply_fade():
             try:
+                self._ensure_writable()
                 fade_in_samples = int(fade_in_var.get() * self.sample_rate)
                 fade_out_samples = int(fade_out_var.get() * self.sample_rate)
                 
-                # Apply fade in
+                # Apply fade in/out with cached ramps, multiplying in
+                # place so no envelope or upcast buffer is allocated
                 if fade_in_samples > 0:
-                    fade_in = np.linspace(0, 1, fade_in_samples)
-                    self.audio_data[:fade_in_samples] *= fade_in
+                    view = self.audio_data[:fade_in_samples]
+                    np.multiply(view, _fade_ramp(fade_in_samples, True), out=view)
                 
-                # Apply fade out
                 if fade_out_samples > 0:
-                    fade_out = np.linspace(1, 0, fade_out_samples)
-                    self.audio_data[-fade_out_samples:] *= fade_out
+                    view = self.audio_data[-fade_out_samples:]
+                    np.multiply(view, _fade_ramp(fade_out_samples, False), out=view)
+
+                # Fades mutate in place, so the cache must be dropped explicitly
+                self._wf_cache = None
                 
                 # Update UI
                 self._draw_waveform()
@@ -459,7 +703,14 @@ class AudioTools:
     def _reverse_audio(self):
         """Reverse the audio."""
         try:
-            self.audio_data = np.flip(self.audio_data)
+            self._ensure_writable()
+            # One explicit contiguous copy instead of np.flip's reversed
+            # view, which would force a hidden copy in the real-time path
+            # every time sounddevice consumes a non-contiguous slice
+            reversed_data = np.empty_like(self.audio_data)
+            np.copyto(reversed_data, self.audio_data[::-1])
+            self.audio_data = reversed_data
+            self._wf_cache = None
             self._draw_waveform()
             self.status_var.set("Audio reversed")
         except Exception as e:
@@ -477,8 +728,24 @@ class AudioTools:
         )
         
         if file_path:
-            try:
-                sf.write(file_path, self.audio_data, self.sample_rate)
-                self.status_var.set(f"Saved: {file_path.split('/')[-1]}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save audio: {e}")
+            # Write on a background thread - sf.write of a long buffer
+            # would otherwise block the Tk event loop for the whole save
+            self._ensure_writable()
+            self.status_var.set(f"Saving: {os.path.basename(file_path)}...")
+            threading.Thread(target=self._save_worker, args=(file_path,),
+                             daemon=True).start()
+
+    def _save_worker(self, file_path):
+        """Stream the audio to disk in bounded segments off the Tk thread."""
+        try:
+            data = self.audio_data
+            seg = self.sample_rate * 30
+            with sf.SoundFile(file_path, 'w', samplerate=self.sample_rate,
+                              channels=1, subtype='FLOAT') as f:
+                for start in range(0, len(data), seg):
+                    f.write(data[start:start + seg])
+            self.window.after(0, self.status_var.set,
+                              f"Saved: {os.path.basename(file_path)}")
+        except Exception as e:
+            self.window.after(0, messagebox.showerror, "Error",
+                              f"Failed to save audio: {e}")
@@ -0,0 +1,93 @@
+"""
+SQLite-backed Chat History Store for CodedSwitch Application
+
+Keeps the full conversation on disk (WAL-mode SQLite) with a bounded
+in-memory window of recent messages, so resident memory stays constant
+no matter how long the session runs and exports can stream row by row.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+import sqlite3
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class ChatStore:
+    """Persistent chat history with a bounded in-memory recent window."""
+
+    def __init__(self, db_path=None, window=200):
+        if db_path is None:
+            config_dir = os.path.join(os.path.expanduser("~"), ".codedswitch")
+            os.makedirs(config_dir, exist_ok=True)
+            db_path = os.path.join(config_dir, "chat_history.db")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "id INTEGER PRIMARY KEY, ts TEXT, sender TEXT, "
+            "type TEXT, message TEXT)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        # Recent-message window for cheap in-process reads
+        self.recent = deque(maxlen=window)
+
+    def add(self, timestamp, sender, msg_type, message):
+        """Append one message to disk and the in-memory window."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO messages (ts, sender, type, message) VALUES (?, ?, ?, ?)",
+                (timestamp, sender, msg_type, message),
+            )
+            self._conn.commit()
+        self.recent.append({
+            "sender": sender,
+            "message": message,
+            "timestamp": timestamp,
+            "type": msg_type,
+        })
+
+    def add_many(self, rows):
+        """Batch-insert (ts, sender, type, message) tuples in one transaction."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO messages (ts, sender, type, message) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Drop all stored messages."""
+        with self._lock:
+            self._conn.execute("DELETE FROM messages")
+            self._conn.commit()
+        self.recent.clear()
+
+    def count(self):
+        """Number of messages on disk."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()
+        return row[0]
+
+    def iter_messages(self):
+        """Yield message dicts oldest-first from a server-side cursor."""
+        cursor = self._conn.execute(
+            "SELECT ts, sender, type, message FROM messages ORDER BY id"
+        )
+        for ts, sender, msg_type, message in cursor:
+            yield {
+                "sender": sender,
+                "message": message,
+                "timestamp": ts,
+                "type": msg_type,
+            }
+
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
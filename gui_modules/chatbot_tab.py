@@ -7,16 +7,93 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import ttkbootstrap as ttk
-from ttkbootstrap.scrolled import ScrolledText as TtkScrolledText
+from tkinter import messagebox
+import atexit
+import concurrent.futures
+import functools
 import logging
-import threading
-from datetime import datetime
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Constant UI payloads built once at import; _clear_chat re-posts the
+# welcome message, so it would otherwise be rebuilt on every clear
+_WELCOME_MSG = """🎤 Welcome to Astutely, your CodedSwitch AI assistant! 🎤
+
+I'm here to help you with:
+• Code translation between programming languages
+• Programming questions and explanations
+• Code debugging and optimization
+• General tech discussions
+
+Feel free to ask me anything or try these examples:
+• "Translate this Python code to JavaScript: [your code]"
+• "What's the difference between Python and Java?"
+• "How do I optimize this algorithm?"
+
+Let's code together! 🚀"""
+
+_EXAMPLES_MSG = """💡 Try these example prompts:
+
+🔄 Translation Examples:
+• "Translate this Python function to JavaScript: def hello(): print('Hello')"
+• "Convert this Java loop to Python: for(int i=0; i<10; i++)"
+• "Change this C++ code to Rust: [your code]"
+
+❓ Programming Questions:
+• "What's the difference between Python lists and tuples?"
+• "How do I handle exceptions in JavaScript?"
+• "Explain object-oriented programming concepts"
+
+🔧 Code Help:
+• "How can I optimize this algorithm?"
+• "What's wrong with this code?"
+• "Best practices for [programming concept]"
+
+🎤 Fun CodedSwitch Style:
+• "Explain Python in rap lyrics"
+• "Write a tech poem about debugging"
+• "Create a programming joke"
+
+Just type your question and I'll help you out! 🚀"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ttk():
+    """Import ttkbootstrap on first use - it is heavy and only needed once
+    the tab is actually built, so module import stays cheap."""
+    import ttkbootstrap as ttk
+    from ttkbootstrap.scrolled import ScrolledText
+    return ttk, ScrolledText
+
+
+# Compiled once at import: one linear C-level scan per message instead of
+# a Python substring search per keyword
+_TRANSLATION_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(k) for k in ('translate', 'convert', 'change to', 'from', 'to'))
+)
+_CODE_INDICATORS_RE = re.compile(
+    "|".join(re.escape(i) for i in ('def ', 'function ', 'class ', '{', '}', '()', 'import ', 'using ', '#include'))
+)
+
 # Safe imports
+try:
+    from .chat_store import ChatStore
+except ImportError:
+    try:
+        from chat_store import ChatStore
+    except ImportError:
+        ChatStore = None
+
+try:
+    from .response_cache import ResponseCache
+except ImportError:
+    try:
+        from response_cache import ResponseCache
+    except ImportError:
+        ResponseCache = None
+
 try:
     from .utils import ErrorHandler
 except ImportError:
@@ -40,15 +117,50 @@ except ImportError:
 class ChatbotTab:
     """Handles all chatbot tab functionality."""
     
+    # Pending display writes flush after this many ms, or synchronously
+    # once the buffer holds this many entries
+    _FLUSH_DELAY_MS = 25
+    _FLUSH_THRESHOLD = 64
+    
+    _BOLD_FONT = ('Arial', 10, 'bold')
+    
     def __init__(self, parent, ai_interface):
         self.parent = parent
         self.ai = ai_interface
-        self.conversation_history = []
+        self.root = parent.root
+        # The parent creates status_var after the tabs, so it is resolved
+        # lazily on first use rather than guarded with hasattr per call
+        self._set_parent_status = None
+        # Full history lives in SQLite; conversation_history is the bounded
+        # in-memory window of recent messages
+        self._chat_store = ChatStore() if ChatStore else None
+        if self._chat_store is not None:
+            self.conversation_history = self._chat_store.recent
+        else:
+            self.conversation_history = []
+        # Local cache short-circuits repeat prompts before any LLM call
+        self._response_cache = ResponseCache() if ResponseCache else None
+        self._pending = []  # display writes waiting for the next flush
+        self._flush_scheduled = False
+        # One persistent pool instead of a thread per send: no per-message
+        # thread-create cost and at most two LLM calls in flight
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="chat")
+        atexit.register(self._pool.shutdown, wait=False)
+        # Prompt context stays bounded: the last N turns go out verbatim,
+        # older turns are folded into a compact rolling summary
+        self._verbatim_window = 8
+        self._context_turns = []
+        self._history_summary = ""
+        # Timestamp string is recomputed once per minute, not per message
+        self._ts_minute = -1
+        self._ts_str = ""
         self.setup_chatbot_tab()
         self._add_welcome_message()
     
     def setup_chatbot_tab(self):
         """Set up the chatbot tab with enhanced UI."""
+        ttk, TtkScrolledText = _get_ttk()
         
         # Main frame
         main_frame = ttk.Frame(self.parent.chatbot_tab)
@@ -67,6 +179,11 @@ class ChatbotTab:
         if not hasattr(self.parent.chat_display, "xview"):
             self.parent.chat_display.xview = self.parent.chat_display.text.xview  # type: ignore
         
+        # Configure text tags once; tag options persist on the widget
+        self.parent.chat_display.text.tag_config("user_header", foreground="#4CAF50", font=self._BOLD_FONT)
+        self.parent.chat_display.text.tag_config("assistant_header", foreground="#2196F3", font=self._BOLD_FONT)
+        self.parent.chat_display.text.tag_config("error_header", foreground="#FF6B6B", font=self._BOLD_FONT)
+        
         # Input frame
         input_frame = ttk.Frame(main_frame)
         input_frame.pack(fill=tk.X, pady=(0, 10))
@@ -114,22 +231,7 @@ class ChatbotTab:
     
     def _add_welcome_message(self):
         """Add welcome message to chat."""
-        welcome_msg = """🎤 Welcome to Astutely, your CodedSwitch AI assistant! 🎤
-
-I'm here to help you with:
-• Code translation between programming languages
-• Programming questions and explanations
-• Code debugging and optimization
-• General tech discussions
-
-Feel free to ask me anything or try these examples:
-• "Translate this Python code to JavaScript: [your code]"
-• "What's the difference between Python and Java?"
-• "How do I optimize this algorithm?"
-
-Let's code together! 🚀"""
-        
-        self._add_message_to_display("Astutely", welcome_msg, "assistant")
+        self._add_message_to_display("Astutely", _WELCOME_MSG, "assistant")
     
     @ErrorHandler.handle_error("Send Message")
     def send_message(self, event=None):
@@ -150,103 +252,166 @@ Let's code together! 🚀"""
         # Add user message to display
         self._add_message_to_display("You", message, "user")
         
+        # Serve near-duplicate prompts from the local cache - no network
+        # round-trip, no thread
+        if self._response_cache is not None:
+            cached = self._response_cache.get(message)
+            if cached is not None:
+                self._add_message_to_display("Assistant", cached, "assistant")
+                self._set_status("Ready (cached)")
+                return
+        
         # Update status
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("🤖 AI is thinking...")
+        self._set_status("🤖 AI is thinking...")
         
         # Disable send button during processing
         self.send_btn.config(state='disabled')
         
-        def chat_worker():
+        # Run chat on the persistent pool; the done callback marshals the
+        # result back to the Tk thread
+        prompt = self._prompt_with_context(message)
+        future = self._pool.submit(self.parent.ai_interface.chat_response, prompt)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_chat_response, message, f))
+    
+    def _on_chat_response(self, message, future):
+        """Handle a completed chat request on the main thread."""
+        try:
             try:
-                # Get AI response
-                response = self.parent.ai_interface.chat_response(message)
-                
-                # Update UI on main thread
-                self.parent.root.after(0, lambda: self._add_message_to_display("Assistant", response, "assistant"))
-                
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.root.after(0, lambda: self.parent.status_var.set("Ready"))
-                
+                response = future.result()
             except Exception as e:
-                error_msg = f"Chat error: {str(e)}"
-                self.parent.root.after(0, lambda: self._add_message_to_display("System", error_msg, "error"))
-                
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.root.after(0, lambda: self.parent.status_var.set("Ready"))
-                
+                self._add_message_to_display("System", f"Chat error: {str(e)}", "error")
                 logger.error(f"Chat error: {e}", exc_info=True)
-            finally:
-                # Re-enable send button
-                self.parent.root.after(0, lambda: self.send_btn.config(state='normal'))
-        
-        # Run chat in background thread
-        thread = threading.Thread(target=chat_worker)
-        thread.daemon = True
-        thread.start()
+            else:
+                if self._response_cache is not None:
+                    self._response_cache.put(message, response)
+                self._context_turns.append(("User", message))
+                self._context_turns.append(("Assistant", response))
+                self._fold_history()
+                self._add_message_to_display("Assistant", response, "assistant")
+            
+            self._set_status("Ready")
+        finally:
+            # Re-enable send button
+            self.send_btn.config(state='normal')
+    
+    def _prompt_with_context(self, message: str) -> str:
+        """Prepend the bounded conversation context to an outgoing prompt."""
+        parts = []
+        if self._history_summary:
+            parts.append(f"Conversation summary:\n{self._history_summary}")
+        recent = self._context_turns[-self._verbatim_window:]
+        if recent:
+            parts.append("Recent conversation:\n"
+                         + "\n".join(f"{sender}: {text}" for sender, text in recent))
+        if not parts:
+            return message
+        parts.append(f"User: {message}")
+        return "\n\n".join(parts)
+    
+    def _fold_history(self):
+        """Compact turns older than the verbatim window into the summary."""
+        if len(self._context_turns) <= 2 * self._verbatim_window:
+            return
+        older = self._context_turns[:-self._verbatim_window]
+        del self._context_turns[:-self._verbatim_window]
+        lines = [f"{sender}: {text.splitlines()[0][:120]}"
+                 for sender, text in older if text.strip()]
+        merged = "\n".join([self._history_summary] + lines if self._history_summary else lines)
+        # The summary itself stays bounded too
+        self._history_summary = merged[-2000:]
     
     def _is_translation_request(self, message: str) -> bool:
         """Check if message is a code translation request."""
-        translation_keywords = ['translate', 'convert', 'change to', 'from', 'to']
-        code_indicators = ['def ', 'function ', 'class ', '{', '}', '()', 'import ', 'using ', '#include']
-        
-        message_lower = message.lower()
-        has_translation_keyword = any(keyword in message_lower for keyword in translation_keywords)
-        has_code = any(indicator in message for indicator in code_indicators)
-        
-        return has_translation_keyword and has_code
+        return (_TRANSLATION_KEYWORDS_RE.search(message.lower()) is not None
+                and _CODE_INDICATORS_RE.search(message) is not None)
+    
+    def _set_status(self, text: str):
+        """Set the shared status bar text, caching the method lookup."""
+        if self._set_parent_status is None:
+            self._set_parent_status = getattr(self.parent, 'set_status', None)
+            if self._set_parent_status is None:
+                return
+        self._set_parent_status(text)
+    
+    def _timestamp(self) -> str:
+        """Return the current HH:MM string, running strftime once per minute."""
+        t = int(time.time())
+        if t // 60 != self._ts_minute:
+            self._ts_minute = t // 60
+            self._ts_str = time.strftime("%H:%M", time.localtime(t))
+        return self._ts_str
     
     def _add_message_to_display(self, sender: str, message: str, msg_type: str = "user"):
         """Add message to chat display with formatting."""
-        timestamp = datetime.now().strftime("%H:%M")
-        
-        self.parent.chat_display.text.config(state=tk.NORMAL)
+        timestamp = self._timestamp()
         
         # Format based on message type
         if msg_type == "user":
-            prefix = f"[{timestamp}] 👤 {sender}: "
-            self.parent.chat_display.text.insert(tk.END, prefix, "user_header")
+            prefix, tag = f"[{timestamp}] 👤 {sender}: ", "user_header"
         elif msg_type == "assistant":
-            prefix = f"[{timestamp}] 🤖 Assistant: "
-            self.parent.chat_display.text.insert(tk.END, prefix, "assistant_header")
+            prefix, tag = f"[{timestamp}] 🤖 Assistant: ", "assistant_header"
         elif msg_type == "error":
-            prefix = f"[{timestamp}] ❌ Error: "
-            self.parent.chat_display.text.insert(tk.END, prefix, "error_header")
+            prefix, tag = f"[{timestamp}] ❌ Error: ", "error_header"
         else:
-            prefix = f"[{timestamp}] {sender}: "
-            self.parent.chat_display.text.insert(tk.END, prefix)
+            prefix, tag = f"[{timestamp}] {sender}: ", None
         
-        # Add message content
-        self.parent.chat_display.text.insert(tk.END, f"{message}\n\n")
-        
-        # Configure text tags for formatting
-        self.parent.chat_display.text.tag_config("user_header", foreground="#4CAF50", font=('Arial', 10, 'bold'))
-        self.parent.chat_display.text.tag_config("assistant_header", foreground="#2196F3", font=('Arial', 10, 'bold'))
-        self.parent.chat_display.text.tag_config("error_header", foreground="#FF6B6B", font=('Arial', 10, 'bold'))
-        
-        self.parent.chat_display.text.config(state=tk.DISABLED)
-        self.parent.chat_display.text.see(tk.END)
+        # Coalesce widget mutations: everything arriving within the same
+        # ~25 ms window renders under one NORMAL/DISABLED toggle and redraw
+        self._pending.append((prefix, tag, f"{message}\n\n"))
+        if len(self._pending) >= self._FLUSH_THRESHOLD:
+            self._flush_display()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(self._FLUSH_DELAY_MS, self._flush_display)
         
         # Add to conversation history
-        self.conversation_history.append({
-            "sender": sender,
-            "message": message,
-            "timestamp": timestamp,
-            "type": msg_type
-        })
+        if self._chat_store is not None:
+            self._chat_store.add(timestamp, sender, msg_type, message)
+        else:
+            self.conversation_history.append({
+                "sender": sender,
+                "message": message,
+                "timestamp": timestamp,
+                "type": msg_type
+            })
+    
+    def _flush_display(self):
+        """Apply all pending chat inserts in a single widget update."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        
+        text = self.parent.chat_display.text
+        text.config(state=tk.NORMAL)
+        for prefix, tag, body in pending:
+            if tag:
+                text.insert(tk.END, prefix, tag)
+            else:
+                text.insert(tk.END, prefix)
+            text.insert(tk.END, body)
+        
+        text.config(state=tk.DISABLED)
+        text.see(tk.END)
     
     @ErrorHandler.handle_error("Clear Chat")
     def _clear_chat(self, event=None):
         """Clear the chat display and conversation history."""
+        self._pending.clear()
         self.parent.chat_display.text.config(state=tk.NORMAL)
         self.parent.chat_display.text.delete("1.0", tk.END)
         self.parent.chat_display.text.config(state=tk.DISABLED)
         
-        self.conversation_history.clear()
+        if self._chat_store is not None:
+            self._chat_store.clear()
+        else:
+            self.conversation_history.clear()
+        self._context_turns.clear()
+        self._history_summary = ""
         self._add_welcome_message()
         
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("🗑️ Chat cleared")
+        self._set_status("🗑️ Chat cleared")
         
         logger.info("Chat cleared")
     
@@ -257,6 +422,7 @@ Let's code together! 🚀"""
             messagebox.showinfo("No Chat", "No chat history to export.")
             return
         
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(
             title="Export Chat History",
             defaultextension=".txt",
@@ -269,50 +435,43 @@ Let's code together! 🚀"""
         
         if file_path:
             try:
+                # Stream from the store's cursor so export memory stays flat
+                if self._chat_store is not None:
+                    messages = self._chat_store.iter_messages()
+                else:
+                    messages = iter(self.conversation_history)
+                
                 if file_path.endswith('.json'):
                     import json
+                    # Emit one message per write so the full history is
+                    # never materialized in memory
                     with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(self.conversation_history, f, indent=2)
+                        f.write("[")
+                        for i, msg in enumerate(messages):
+                            if i:
+                                f.write(",\n")
+                            else:
+                                f.write("\n")
+                            f.write(json.dumps(msg, indent=2))
+                        f.write("\n]")
                 else:
                     with open(file_path, 'w', encoding='utf-8') as f:
                         f.write("CodedSwitch Chat History\n")
                         f.write("=" * 50 + "\n\n")
-                        
-                        for msg in self.conversation_history:
-                            f.write(f"[{msg['timestamp']}] {msg['sender']}: {msg['message']}\n\n")
+                        # writelines over a generator lets the file buffer
+                        # batch the syscalls
+                        f.writelines(
+                            f"[{msg['timestamp']}] {msg['sender']}: {msg['message']}\n\n"
+                            for msg in messages
+                        )
                 
                 messagebox.showinfo("Export Complete", f"Chat history exported to: {file_path}")
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.status_var.set(f"💾 Chat exported: {file_path}")
+                self._set_status(f"💾 Chat exported: {file_path}")
                 
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export chat: {str(e)}")
     
     def _show_chat_examples(self):
         """Show example chat prompts."""
-        examples = """💡 Try these example prompts:
-
-🔄 Translation Examples:
-• "Translate this Python function to JavaScript: def hello(): print('Hello')"
-• "Convert this Java loop to Python: for(int i=0; i<10; i++)"
-• "Change this C++ code to Rust: [your code]"
-
-❓ Programming Questions:
-• "What's the difference between Python lists and tuples?"
-• "How do I handle exceptions in JavaScript?"
-• "Explain object-oriented programming concepts"
-
-🔧 Code Help:
-• "How can I optimize this algorithm?"
-• "What's wrong with this code?"
-• "Best practices for [programming concept]"
-
-🎤 Fun CodedSwitch Style:
-• "Explain Python in rap lyrics"
-• "Write a tech poem about debugging"
-• "Create a programming joke"
-
-Just type your question and I'll help you out! 🚀"""
-        
-        messagebox.showinfo("Chat Examples", examples)
\ No newline at end of file
+        messagebox.showinfo("Chat Examples", _EXAMPLES_MSG)
\ No newline at end of file
@@ -5,6 +5,9 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import re
+from types import MappingProxyType
+
 class Constants:
     """Application constants for better maintainability."""
     
@@ -30,6 +33,11 @@ class Constants:
     DEFAULT_MODEL = "gemini-1.5-flash"
     MAX_RETRIES = 3
     TIMEOUT_SECONDS = 30
+    
+    # Response cache settings
+    CACHE_MAX_SIZE = 128
+    CACHE_TTL_SECONDS = 3600
+    CACHE_SIMILARITY_THRESHOLD = 0.90
 
 # Define available themes
 THEMES = {
@@ -42,7 +50,7 @@ THEMES = {
 }
 
 # Programming language options
-PROGRAMMING_LANGUAGES = [
+PROGRAMMING_LANGUAGES = (
     "Python", 
     "JavaScript", 
     "Java", 
@@ -58,9 +66,13 @@ PROGRAMMING_LANGUAGES = [
     "Kotlin",
     "Scala",
     "Perl"
-]
+)
+
+# Frozen set for O(1) membership checks
+PROGRAMMING_LANGUAGES_SET = frozenset(PROGRAMMING_LANGUAGES)
 
-# Enhanced Lyric styles for the Lyric Lab
+# Enhanced Lyric styles for the Lyric Lab. Wrapped read-only so the
+# mappings can be shared across threads without defensive copies
 LYRIC_STYLES = {
     "Boom Bap": {
         "description": "Classic hip-hop with strong emphasis on bars and wordplay",
@@ -111,6 +123,9 @@ LYRIC_STYLES = {
         "prompt_additions": "Emphasize smooth flow, emotional depth, and romantic or personal themes."
     }
 }
+LYRIC_STYLES = MappingProxyType(
+    {style: MappingProxyType(info) for style, info in LYRIC_STYLES.items()}
+)
 
 # File type associations for different languages
 LANGUAGE_EXTENSIONS = {
@@ -130,6 +145,7 @@ LANGUAGE_EXTENSIONS = {
     "Scala": ".scala",
     "Perl": ".pl"
 }
+LANGUAGE_EXTENSIONS = MappingProxyType(LANGUAGE_EXTENSIONS)
 
 # Common security vulnerability patterns
 SECURITY_PATTERNS = {
@@ -160,6 +176,13 @@ SECURITY_PATTERNS = {
     ]
 }
 
+# Precompiled at import time: one alternation per category, so a scan is
+# one search call per category instead of a compile per pattern per line
+SECURITY_PATTERNS_COMPILED = {
+    category: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for category, patterns in SECURITY_PATTERNS.items()
+}
+
 # Error messages
 ERROR_MESSAGES = {
     "NO_API_KEY": "AI interface not initialized. Please configure your API key.",
@@ -10,11 +10,192 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import asyncio
+import atexit
+import collections
+import concurrent.futures
+import hashlib
+import mmap
 import threading
 import logging
+import sqlite3
+import time
 from datetime import datetime
 import json
 import os
+import string
+
+logger = logging.getLogger(__name__)
+
+# Optional phonetic dictionary - answers standard rhyme-scheme requests
+# locally without the LLM
+try:
+    import pronouncing
+except ImportError:
+    pronouncing = None
+
+# Safe imports
+try:
+    from .response_cache import ResponseCache
+except ImportError:
+    try:
+        from response_cache import ResponseCache
+    except ImportError:
+        ResponseCache = None
+
+
+def _pick_hash():
+    """Prefer SHA256 where the CPU executes it natively, else BLAKE2b.
+    
+    BLAKE2b is roughly twice as fast in software, but CPUs with SHA
+    extensions run SHA256 faster still.
+    """
+    try:
+        with open('/proc/cpuinfo') as f:
+            if 'sha_ni' in f.read():
+                return hashlib.sha256
+    except OSError:
+        pass
+    return lambda: hashlib.blake2b(digest_size=32)
+
+
+_HASH = _pick_hash()
+
+
+class TokenBucket:
+    """Token-bucket rate limiter bounding requests and tokens per minute.
+    
+    acquire() blocks until one request plus the estimated token cost fit
+    the refilling budget, so burst clicking can never exceed the
+    provider's RPM/TPM ceilings and trigger 429 backoff.
+    """
+    
+    def __init__(self, rpm=60, tpm=90000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, estimated_tokens=1000):
+        """Block until the request and token budgets cover this call."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last
+                self._last = now
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+                if self._requests >= 1.0 and self._tokens >= estimated_tokens:
+                    self._requests -= 1.0
+                    self._tokens -= estimated_tokens
+                    return
+                wait = max(
+                    (1.0 - self._requests) * 60.0 / self.rpm,
+                    (estimated_tokens - self._tokens) * 60.0 / self.tpm,
+                )
+            time.sleep(wait)
+
+
+# Shared worker pool and rate limiter: threads are reused across clicks
+# and concurrent LLM calls stay bounded
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="lyric-ai")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+_RATE_LIMITER = TokenBucket()
+
+# One background asyncio loop shared by all in-flight calls. Coroutines
+# (and any future streaming provider) cooperate on this single thread;
+# blocking SDK calls hop to the executor via run_in_executor
+_ASYNC_LOOP = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+
+
+def _async_loop():
+    """Return the shared background event loop, starting it on first use."""
+    global _ASYNC_LOOP
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever,
+                             name="lyric-async", daemon=True).start()
+            _ASYNC_LOOP = loop
+    return _ASYNC_LOOP
+
+
+async def _run_blocking(worker):
+    """Await a blocking worker on the shared executor."""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, worker)
+
+# Prompt templates built once at import: no per-call dict/string
+# construction, and the stable prefix text keeps its object identity so
+# provider-side prefix caches can reuse its tokens
+_ANALYSIS_PROMPTS = {
+    "Rhyme Scheme": "Analyze the rhyme scheme of these lyrics. Identify the rhyme pattern, highlight any complex multisyllabic rhymes, and suggest improvements for better flow.",
+    "Flow": "Analyze the flow and rhythm of these lyrics. Check syllable count per line, identify any awkward phrasing, and suggest improvements for better musicality.",
+    "Themes": "Analyze the themes and content of these lyrics. Identify main themes, emotional tone, and provide suggestions for enhancing the message and impact."
+}
+
+# The user's topic goes last so everything before it is a stable
+# per-style prefix - formatted once per style and object-identical
+# across calls, which provider-side prefix caches can exploit
+_GEN_TEMPLATE_PREFIX = (
+    "Write {style} lyrics.\n\n"
+    "Guidelines:\n"
+    "- Match the style and tone of the specified genre\n"
+    "- Use creative and original metaphors\n"
+    "- Maintain consistent rhyme scheme and flow\n"
+    "- Keep it between 8-16 lines\n\n"
+    "Write the lyrics about: "
+)
+
+
+class LyricCache:
+    """Exact-match on-disk cache for AI responses, keyed by prompt hash.
+    
+    Repeat analyses or generations of identical inputs come back as a
+    sub-millisecond disk read instead of a multi-second LLM round-trip.
+    """
+    
+    def __init__(self, db_path=None):
+        if db_path is None:
+            config_dir = os.path.join(os.path.expanduser("~"), ".codedswitch")
+            os.makedirs(config_dir, exist_ok=True)
+            db_path = os.path.join(config_dir, "lyric_cache.db")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(*parts):
+        """Deterministic hex key over the NUL-joined prompt parts."""
+        h = _HASH()
+        for part in parts:
+            h.update(part.encode('utf-8'))
+            h.update(b"\x00")
+        return h.hexdigest()
+    
+    def get(self, key):
+        """Return the cached response for a key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def put(self, key, response):
+        """Write a response through to disk."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time())),
+            )
+            self._conn.commit()
+
 
 class LyricAssistant:
     """AI-powered lyric generation and analysis assistant."""
@@ -23,7 +204,25 @@ class LyricAssistant:
         """Initialize the Lyric Assistant."""
         self.parent = parent
         self.ai = ai_interface
-        self.lyric_history = []
+        # Bounded: old entries fall off instead of growing for the whole session
+        self.lyric_history = collections.deque(maxlen=500)
+        # Append-only on-disk log so history survives restarts; flushed in
+        # batches rather than per entry
+        self._hist_fh = self._open_history_log()
+        self._hist_pending = 0
+        self._cache = LyricCache()
+        # Second layer: embedding-similarity matching catches prompts that
+        # differ by a small edit and so miss the exact hash cache
+        self._semantic_cache = ResponseCache(threshold=0.85) if ResponseCache else None
+        # In-flight futures by cache key: a second identical click awaits
+        # the first call instead of issuing its own
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # Editor text cache: refetched across the Tk bridge only after a
+        # <<Modified>> event, so repeated reads of long lyrics are O(1)
+        self._lyrics_cache = ""
+        self._lyrics_dirty = True
+        self._style_prompt_cache = {}
         self.setup_ui()
     
     def setup_ui(self):
@@ -40,11 +239,20 @@ class LyricAssistant:
         # Input section
         self._create_input_section(main_frame)
         
-        # Analysis section
-        self._create_analysis_section(main_frame)
-        
-        # Generation section
-        self._create_generation_section(main_frame)
+        # Analysis and generation sections are built on first use - each
+        # is a heavyweight set of Tk widgets many sessions never open
+        self._sections_frame = ttk.Frame(main_frame)
+        self._sections_frame.pack(fill=tk.BOTH, expand=True)
+        self._analysis_built = False
+        self._generation_built = False
+        self._analysis_btn = ttk.Button(
+            self._sections_frame, text="🔍 Show Analysis Tools",
+            command=self._show_analysis_section)
+        self._analysis_btn.pack(fill=tk.X, pady=(0, 5))
+        self._generation_btn = ttk.Button(
+            self._sections_frame, text="✨ Show Generator",
+            command=self._show_generation_section)
+        self._generation_btn.pack(fill=tk.X, pady=(0, 5))
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -62,6 +270,7 @@ class LyricAssistant:
             font=('Arial', 10)
         )
         self.lyric_editor.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
+        self.lyric_editor.bind('<<Modified>>', self._on_editor_modified)
         
         # Load/save buttons
         btn_frame = ttk.Frame(frame)
@@ -72,10 +281,30 @@ class LyricAssistant:
         ttk.Button(btn_frame, text="Save Lyrics", 
                   command=self._save_lyrics).pack(side=tk.LEFT)
     
+    def _show_analysis_section(self):
+        """Build and show the analysis section on first request."""
+        if self._analysis_built:
+            return
+        self._analysis_built = True
+        self._analysis_btn.destroy()
+        self._create_analysis_section(self._sections_frame)
+        if self._generation_built:
+            # Keep the analysis section above the generator
+            self._analysis_frame.pack_configure(before=self._generation_frame)
+    
+    def _show_generation_section(self):
+        """Build and show the generation section on first request."""
+        if self._generation_built:
+            return
+        self._generation_built = True
+        self._generation_btn.destroy()
+        self._create_generation_section(self._sections_frame)
+    
     def _create_analysis_section(self, parent):
         """Create the lyric analysis section."""
         frame = ttk.LabelFrame(parent, text="🔍 Analysis", padding=10)
         frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self._analysis_frame = frame
         
         # Analysis options
         options_frame = ttk.Frame(frame)
@@ -86,19 +315,26 @@ class LyricAssistant:
         ttk.Button(options_frame, text="Check Flow",
                   command=self._check_flow).pack(side=tk.LEFT, padx=5)
         ttk.Button(options_frame, text="Themes & Content",
-                  command=self._analyze_themes).pack(side=tk.LEFT)
+                  command=self._analyze_themes).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(options_frame, text="Full Analysis",
+                  command=self._analyze_all).pack(side=tk.LEFT)
         
         # Analysis results
+        # Kept in normal state with keypresses swallowed instead of
+        # toggling state per write: under streaming that toggle would cost
+        # two extra Tcl round-trips per chunk
         self.analysis_results = scrolledtext.ScrolledText(
             frame, wrap=tk.WORD, width=80, height=10,
-            font=('Consolas', 9), state='disabled'
+            font=('Consolas', 9)
         )
         self.analysis_results.pack(fill=tk.BOTH, expand=True)
+        self.analysis_results.bind('<Key>', lambda e: 'break')
     
     def _create_generation_section(self, parent):
         """Create the lyric generation section."""
         frame = ttk.LabelFrame(parent, text="✨ Generate", padding=10)
         frame.pack(fill=tk.BOTH, expand=True)
+        self._generation_frame = frame
         
         # Style selection
         style_frame = ttk.Frame(frame)
@@ -126,6 +362,18 @@ class LyricAssistant:
         ttk.Button(frame, text="Generate Lyrics", 
                   command=self._generate_lyrics).pack(pady=(5, 0))
     
+    def _on_editor_modified(self, event=None):
+        """Invalidate the cached editor text and reset Tk's modified flag."""
+        self._lyrics_dirty = True
+        self.lyric_editor.edit_modified(False)
+    
+    def _current_lyrics(self):
+        """Return the editor text, refetching only after a modification."""
+        if self._lyrics_dirty:
+            self._lyrics_cache = self.lyric_editor.get('1.0', tk.END).strip()
+            self._lyrics_dirty = False
+        return self._lyrics_cache
+    
     def _load_lyrics(self):
         """Load lyrics from a file."""
         file_path = tk.filedialog.askopenfilename(
@@ -133,16 +381,24 @@ class LyricAssistant:
         )
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.lyric_editor.delete('1.0', tk.END)
-                    self.lyric_editor.insert('1.0', f.read())
+                if os.path.getsize(file_path) > 1 << 20:
+                    # Multi-MB corpus: map the file and decode once instead
+                    # of stacking a file buffer on top of the str copy
+                    with open(file_path, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        text = mm[:].decode('utf-8')
+                else:
+                    with open(file_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                        text = f.read()
+                self.lyric_editor.delete('1.0', tk.END)
+                self.lyric_editor.insert('1.0', text)
                 self.status_var.set(f"Loaded lyrics from {os.path.basename(file_path)}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file: {str(e)}")
     
     def _save_lyrics(self):
         """Save lyrics to a file."""
-        lyrics = self.lyric_editor.get('1.0', tk.END).strip()
+        lyrics = self._current_lyrics()
         if not lyrics:
             messagebox.showwarning("No Lyrics", "No lyrics to save.")
             return
@@ -153,15 +409,21 @@ class LyricAssistant:
         )
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                # Write to a sibling temp file and rename into place so a
+                # crash mid-write can never leave a truncated file
+                tmp_path = file_path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                     f.write(lyrics)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
                 self.status_var.set(f"Saved lyrics to {os.path.basename(file_path)}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save file: {str(e)}")
     
     def _analyze_lyrics(self, analysis_type):
         """Analyze lyrics with the specified analysis type."""
-        lyrics = self.lyric_editor.get('1.0', tk.END).strip()
+        lyrics = self._current_lyrics()
         if not lyrics:
             messagebox.showwarning("No Lyrics", "Please enter some lyrics to analyze.")
             return
@@ -169,16 +431,102 @@ class LyricAssistant:
         self.status_var.set(f"Analyzing {analysis_type.lower()}...")
         
         def analyze_worker():
-            try:
-                analysis = self._get_lyric_analysis(lyrics, analysis_type)
-                self.parent.root.after(0, self._display_analysis, analysis_type, analysis)
-                self.parent.root.after(0, lambda: self.status_var.set("Analysis complete"))
-            except Exception as e:
-                self.parent.root.after(0, lambda: messagebox.showerror(
-                    "Analysis Error", f"Failed to analyze lyrics: {str(e)}"))
-                self.parent.root.after(0, lambda: self.status_var.set("Analysis failed"))
+            # Rough token estimate: ~4 chars/token plus response headroom
+            _RATE_LIMITER.acquire(len(lyrics) // 4 + 500)
+            return self._get_lyric_analysis(lyrics, analysis_type)
+        
+        future = self._submit_deduped(
+            LyricCache.key(analysis_type, lyrics), analyze_worker)
+        future.add_done_callback(
+            lambda f: self.parent.root.after(0, self._on_analysis_done, analysis_type, f))
+    
+    def _submit_deduped(self, key, worker):
+        """Submit a worker, reusing the in-flight future for the same key."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = asyncio.run_coroutine_threadsafe(
+                    _run_blocking(worker), _async_loop())
+                self._inflight[key] = future
+                future.add_done_callback(lambda f: self._inflight.pop(key, None))
+        return future
+    
+    def _on_analysis_done(self, analysis_type, future):
+        """Display a completed analysis on the main thread."""
+        try:
+            analysis = future.result()
+        except Exception as e:
+            messagebox.showerror("Analysis Error", f"Failed to analyze lyrics: {str(e)}")
+            self.status_var.set("Analysis failed")
+            return
+        self._display_analysis(analysis_type, analysis)
+        self.status_var.set("Analysis complete")
+    
+    def _analyze_all(self):
+        """Run all three analyses in a single LLM round-trip."""
+        lyrics = self._current_lyrics()
+        if not lyrics:
+            messagebox.showwarning("No Lyrics", "Please enter some lyrics to analyze.")
+            return
+        
+        self.status_var.set("Running full analysis...")
+        
+        def full_worker():
+            _RATE_LIMITER.acquire(len(lyrics) // 4 + 1500)
+            return self._get_full_analysis(lyrics)
         
-        threading.Thread(target=analyze_worker, daemon=True).start()
+        future = self._submit_deduped(LyricCache.key("Full", lyrics), full_worker)
+        future.add_done_callback(
+            lambda f: self.parent.root.after(0, self._on_analysis_done, "Full", f))
+    
+    def _get_full_analysis(self, lyrics):
+        """Fetch all three analysis sections with one structured request."""
+        prompt = (
+            "Analyze these lyrics and return JSON with exactly the keys "
+            '"rhyme_scheme", "flow" and "themes", each a string covering the '
+            "corresponding analysis (rhyme pattern and multisyllabic rhymes; "
+            "syllable count and phrasing; main themes and emotional tone), "
+            "with concrete suggestions for improvement.\n\n"
+            f"{lyrics}"
+        )
+        
+        try:
+            response = self.ai.chat_response(prompt)
+        except Exception as e:
+            raise Exception(f"AI analysis failed: {str(e)}")
+        
+        sections = self._parse_full_analysis(response)
+        if sections is None:
+            # Unparseable output - show it raw rather than dropping it
+            return response
+        
+        # Seed the per-section cache so the individual buttons now hit
+        # without another round-trip
+        for analysis_type, text in sections.items():
+            self._cache.put(LyricCache.key(analysis_type, lyrics), text)
+        
+        return "\n\n".join(
+            f"=== {analysis_type} Analysis ===\n\n{text}"
+            for analysis_type, text in sections.items()
+        )
+    
+    @staticmethod
+    def _parse_full_analysis(response):
+        """Parse the structured response into per-section texts, or None."""
+        text = response.strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+        try:
+            data = json.loads(text)
+        except (ValueError, TypeError):
+            return None
+        key_map = {"rhyme_scheme": "Rhyme Scheme", "flow": "Flow", "themes": "Themes"}
+        sections = {
+            label: str(data[key]) for key, label in key_map.items() if key in data
+        }
+        return sections or None
     
     def _analyze_rhyme_scheme(self):
         """Analyze the rhyme scheme of the lyrics."""
@@ -194,26 +542,98 @@ class LyricAssistant:
     
     def _get_lyric_analysis(self, lyrics, analysis_type):
         """Get AI analysis of lyrics based on the specified type."""
-        prompts = {
-            "Rhyme Scheme": "Analyze the rhyme scheme of these lyrics. Identify the rhyme pattern, highlight any complex multisyllabic rhymes, and suggest improvements for better flow.",
-            "Flow": "Analyze the flow and rhythm of these lyrics. Check syllable count per line, identify any awkward phrasing, and suggest improvements for better musicality.",
-            "Themes": "Analyze the themes and content of these lyrics. Identify main themes, emotional tone, and provide suggestions for enhancing the message and impact."
-        }
+        prompt = f"{_ANALYSIS_PROMPTS.get(analysis_type, 'Analyze these lyrics:')}\n\n{lyrics}"
+        
+        # Cache lookup before inference, write-through on miss
+        cache_key = LyricCache.key(analysis_type, lyrics)
+        response = self._cache.get(cache_key)
+        if response is None and self._semantic_cache is not None:
+            response = self._semantic_cache.get(prompt)
+        if response is None and analysis_type == "Rhyme Scheme":
+            # Trivial-query short circuit: phonetic matching resolves most
+            # rhyme schemes in milliseconds; the LLM only sees the hard cases
+            local = self._local_rhyme_scheme(lyrics)
+            if local is not None:
+                return f"=== {analysis_type} Analysis ===\n\n{local}"
+        if response is None:
+            try:
+                stream = getattr(self.ai, 'chat_response_stream', None)
+                if stream is not None:
+                    # Progressive render: chunks land in the results pane as
+                    # they arrive, so the wait is time-to-first-token rather
+                    # than full completion time
+                    parts = []
+                    self.parent.root.after(
+                        0, self._begin_stream_display,
+                        f"=== {analysis_type} Analysis ===\n\n")
+                    for chunk in stream(prompt):
+                        parts.append(chunk)
+                        self.parent.root.after(0, self._append_stream_chunk, chunk)
+                    response = "".join(parts)
+                else:
+                    response = self.ai.chat_response(prompt)
+            except Exception as e:
+                raise Exception(f"AI analysis failed: {str(e)}")
+            self._cache.put(cache_key, response)
+            if self._semantic_cache is not None:
+                self._semantic_cache.put(prompt, response)
+        return f"=== {analysis_type} Analysis ===\n\n{response}"
+    
+    def _begin_stream_display(self, header):
+        """Clear the results pane and write the header for a new stream."""
+        self.analysis_results.delete('1.0', tk.END)
+        self.analysis_results.insert('1.0', header)
+    
+    def _append_stream_chunk(self, chunk):
+        """Append one streamed chunk to the results pane."""
+        self.analysis_results.insert(tk.END, chunk)
+        self.analysis_results.see(tk.END)
+    
+    @staticmethod
+    def _local_rhyme_scheme(lyrics):
+        """Label line-end rhymes phonetically, or None when unsure.
         
-        prompt = f"{prompts.get(analysis_type, 'Analyze these lyrics:')}\n\n{lyrics}"
+        Groups lines by the rhyming part (last stressed vowel onward) of
+        their final word and assigns scheme letters. Returns None when the
+        dictionary misses more than 30% of line endings so the AI path can
+        take over.
+        """
+        if pronouncing is None:
+            return None
+        lines = [line.strip() for line in lyrics.splitlines() if line.strip()]
+        if len(lines) < 2:
+            return None
         
-        try:
-            response = self.ai.chat_response(prompt)
-            return f"=== {analysis_type} Analysis ===\n\n{response}"
-        except Exception as e:
-            raise Exception(f"AI analysis failed: {str(e)}")
+        tails = []
+        missing = 0
+        for line in lines:
+            word = line.split()[-1].strip(string.punctuation).lower()
+            phones = pronouncing.phones_for_word(word)
+            if not phones:
+                missing += 1
+                tails.append(None)
+            else:
+                tails.append(pronouncing.rhyming_part(phones[0]))
+        if missing > 0.3 * len(lines):
+            return None
+        
+        letters = {}
+        scheme = []
+        for tail in tails:
+            if tail is None:
+                scheme.append('-')
+            else:
+                if tail not in letters:
+                    letters[tail] = string.ascii_uppercase[len(letters) % 26]
+                scheme.append(letters[tail])
+        
+        body = "\n".join(f"{letter}  {line}" for letter, line in zip(scheme, lines))
+        return f"Detected rhyme scheme: {''.join(scheme)}\n\n{body}"
     
     def _display_analysis(self, analysis_type, analysis):
         """Display the analysis results."""
-        self.analysis_results.config(state='normal')
         self.analysis_results.delete('1.0', tk.END)
         self.analysis_results.insert('1.0', analysis)
-        self.analysis_results.config(state='disabled')
         
         # Add to history
         self._add_to_history(analysis_type, analysis)
@@ -230,32 +650,45 @@ class LyricAssistant:
         self.status_var.set(f"Generating {style.lower()} lyrics...")
         
         def generate_worker():
-            try:
-                generated = self._generate_with_ai(prompt, style)
-                self.parent.root.after(0, self._display_generated_lyrics, generated)
-                self.parent.root.after(0, lambda: self.status_var.set("Generation complete"))
-            except Exception as e:
-                self.parent.root.after(0, lambda: messagebox.showerror(
-                    "Generation Error", f"Failed to generate lyrics: {str(e)}"))
-                self.parent.root.after(0, lambda: self.status_var.set("Generation failed"))
+            _RATE_LIMITER.acquire(len(prompt) // 4 + 500)
+            return self._generate_with_ai(prompt, style)
         
-        threading.Thread(target=generate_worker, daemon=True).start()
+        future = self._submit_deduped(LyricCache.key(style, prompt), generate_worker)
+        future.add_done_callback(
+            lambda f: self.parent.root.after(0, self._on_generation_done, f))
+    
+    def _on_generation_done(self, future):
+        """Display completed generation on the main thread."""
+        try:
+            generated = future.result()
+        except Exception as e:
+            messagebox.showerror("Generation Error", f"Failed to generate lyrics: {str(e)}")
+            self.status_var.set("Generation failed")
+            return
+        self._display_generated_lyrics(generated)
+        self.status_var.set("Generation complete")
     
     def _generate_with_ai(self, prompt, style):
         """Generate lyrics using the AI interface."""
-        generation_prompt = (
-            f"Write {style} lyrics about: {prompt}\n\n"
-            "Guidelines:\n"
-            "- Match the style and tone of the specified genre\n"
-            "- Use creative and original metaphors\n"
-            "- Maintain consistent rhyme scheme and flow\n"
-            "- Keep it between 8-16 lines"
-        )
+        base = self._style_prompt_cache.setdefault(
+            style, _GEN_TEMPLATE_PREFIX.format(style=style))
+        generation_prompt = base + prompt
+        
+        cache_key = LyricCache.key(style, prompt)
+        cached = self._cache.get(cache_key)
+        if cached is None and self._semantic_cache is not None:
+            cached = self._semantic_cache.get(generation_prompt)
+        if cached is not None:
+            return cached
         
         try:
-            return self.ai.chat_response(generation_prompt)
+            response = self.ai.chat_response(generation_prompt)
         except Exception as e:
             raise Exception(f"AI generation failed: {str(e)}")
+        self._cache.put(cache_key, response)
+        if self._semantic_cache is not None:
+            self._semantic_cache.put(generation_prompt, response)
+        return response
     
     def _display_generated_lyrics(self, lyrics):
         """Display the generated lyrics in the editor."""
@@ -265,14 +698,39 @@ class LyricAssistant:
         # Add to history
         self._add_to_history("Generated Lyrics", lyrics)
     
+    @staticmethod
+    def _open_history_log():
+        """Open the persistent JSONL history log for appending."""
+        try:
+            config_dir = os.path.join(os.path.expanduser("~"), ".codedswitch")
+            os.makedirs(config_dir, exist_ok=True)
+            fh = open(os.path.join(config_dir, "lyric_history.jsonl"),
+                      'a', encoding='utf-8', buffering=1 << 16)
+        except OSError as e:
+            logger.warning(f"Lyric history persistence disabled: {e}")
+            return None
+        atexit.register(fh.close)
+        return fh
+    
     def _add_to_history(self, action, content):
         """Add an action to the history log."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.lyric_history.append({
+        snippet = content if len(content) <= 100 else f"{content[:100]}..."
+        entry = {
             'timestamp': timestamp,
             'action': action,
-            'content': content[:100] + '...' if len(content) > 100 else content
-        })
+            'content': snippet
+        }
+        self.lyric_history.append(entry)
+        
+        if self._hist_fh is not None:
+            # Sequential append, no re-serialization of prior entries;
+            # flushed every 50 writes to amortize the syscall
+            self._hist_fh.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            self._hist_pending += 1
+            if self._hist_pending >= 50:
+                self._hist_fh.flush()
+                self._hist_pending = 0
         
         # Update status
         self.status_var.set(f"{action} completed at {timestamp}")
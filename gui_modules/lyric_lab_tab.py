@@ -8,7 +8,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
+from tkinter.scrolledtext import ScrolledText
+import atexit
+import concurrent.futures
 import json
 import os
 from datetime import datetime
@@ -17,14 +19,86 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the lyric analysis helpers, compiled once per process
+# instead of per call
+_WORD_RE = re.compile(r"\b\w+\b")
+_LINE_END_RE = re.compile(r"(\w+)\W*$", re.MULTILINE)
+_VOWEL_RE = re.compile(r"[aeiouAEIOU]+")
+_NONEMPTY_LINE_RE = re.compile(r"^[ \t]*\S", re.MULTILINE)
+
+
+# Static prompt scaffolding built once at import; only the lyrics slot
+# is filled per call
+_ANALYSIS_PROMPT_TMPL = """Provide a comprehensive analysis of these lyrics:
+
+{lyrics}
+
+Include:
+1. Rhyme scheme and patterns
+2. Flow and rhythm analysis
+3. Emotional content and themes
+4. Literary devices used
+5. Overall quality assessment
+6. Suggestions for improvement
+7. Musical style recommendations
+
+Be detailed and constructive."""
+
+
+def _timestamp(seconds=True):
+    """Local timestamp via direct formatting, skipping strftime's parser."""
+    now = datetime.now()
+    ts = f"{now.year:04}-{now.month:02}-{now.day:02} {now.hour:02}:{now.minute:02}"
+    return f"{ts}:{now.second:02}" if seconds else ts
+
+class _TextPeer(tk.Text):
+    """A Text widget sharing another Text's underlying buffer (Tk peer).
+    
+    Opening a dialog with a peer costs no copy of the backing document,
+    unlike inserting the text into a freshly built widget.
+    """
+    
+    _serial = 0
+    
+    def __init__(self, master, source, cnf={}, **kw):
+        _TextPeer._serial += 1
+        name = f"textpeer{_TextPeer._serial}"
+        # Create the Tk-side peer first, then attach this wrapper to it
+        source.tk.call(source._w, 'peer', 'create', f"{master._w}.{name}",
+                       *source._options(cnf, kw))
+        tk.BaseWidget._setup(self, master, {'name': name})
+
+
 class LyricLabTab:
     """Complete Lyric Lab tab with AI integration and Beat Studio connection."""
     
+    # Immutable, shared by every instance: no per-build list allocation
+    LYRIC_STYLE_NAMES = ("CodedSwitch", "Hip-Hop", "Trap", "Pop", "R&B", "Rock")
+    
+    # Lines inserted per batch when rendering long analysis results
+    _RESULT_CHUNK_LINES = 200
+    
     def __init__(self, parent, ai_interface=None):
         """Initialize the Lyric Lab tab."""
         self.parent = parent
         self.ai_interface = ai_interface  # Store AI interface directly
         self.generated_beat_data = None
+        # The parent creates the status bar after the tabs, so its
+        # set_status is resolved lazily instead of hasattr-probed per call
+        self._set_parent_status = None
+        # Hidden Text owning the style-guide buffer; dialogs show peers of it
+        self._style_info_backing = None
+        # Word/line counts refresh once per settled burst of keystrokes
+        self._last_word_count = 0
+        self._last_line_count = 0
+        self._pending_recount_id = None
+        # One snapshot of the editor text shared by every consumer,
+        # invalidated by the <<Modified>> binding below
+        self._lyrics_cache = None
+        # Reused worker threads instead of a fresh daemon thread per click
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="lyriclab")
+        atexit.register(self._executor.shutdown, wait=False)
         
         # Define lyric styles
         self.LYRIC_STYLES = {
@@ -36,6 +110,15 @@ class LyricLabTab:
             "Rock": "Rock anthems with powerful lyrics and driving energy"
         }
         
+        # Style data is immutable, so the info-dialog text is built once
+        # here instead of being re-concatenated on every dialog open
+        self._style_info_text = (
+            "LYRIC STYLE GUIDE\n" + "=" * 50 + "\n\n"
+            + "".join(f"🎵 {style.upper()}\n   {description}\n\n"
+                      for style, description in self.LYRIC_STYLES.items())
+            + "\n💡 TIP: Choose the style that best matches your intended mood and message!"
+        )
+        
         self.setup_lyric_lab_tab()
         logger.info("LyricLabTab initialized successfully")
     
@@ -56,7 +139,7 @@ class LyricLabTab:
         style_frame = ttk.LabelFrame(main_frame, text="🎵 Lyric Style", padding=10)
         style_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.lyric_style = ttk.Combobox(style_frame, values=list(self.LYRIC_STYLES.keys()),
+        self.lyric_style = ttk.Combobox(style_frame, values=self.LYRIC_STYLE_NAMES,
                                        state="readonly", width=20)
         self.lyric_style.set("CodedSwitch")
         self.lyric_style.pack(side=tk.LEFT, padx=(0, 10))
@@ -72,7 +155,6 @@ class LyricLabTab:
         prompt_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Create scrolled text widget
-        from tkinter.scrolledtext import ScrolledText
         self.lyric_prompt = ScrolledText(prompt_frame, height=3, wrap=tk.WORD,
                                         font=('Arial', 10))
         self.lyric_prompt.pack(fill=tk.X, pady=(0, 10))
@@ -107,10 +189,20 @@ class LyricLabTab:
         editor_frame = ttk.LabelFrame(main_frame, text="📝 Lyric Editor", padding=10)
         editor_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        self.lyric_editor = ScrolledText(editor_frame, wrap=tk.WORD,
-                                        font=('Arial', 11))
-        self.lyric_editor.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        # Plain tk.Text with explicit scrollbar wiring: no cursor-blink
+        # repaints (insertofftime=0) and a bounded undo stack, which keeps
+        # scrolling smooth on imported songbook-sized documents
+        text_frame = ttk.Frame(editor_frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self.lyric_editor = tk.Text(text_frame, wrap=tk.WORD, font=('Arial', 11),
+                                    undo=True, maxundo=200, insertofftime=0)
+        editor_vsb = ttk.Scrollbar(text_frame, orient='vertical',
+                                   command=self.lyric_editor.yview)
+        self.lyric_editor.configure(yscrollcommand=editor_vsb.set)
+        editor_vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.lyric_editor.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.lyric_editor.bind('<KeyRelease>', self._on_lyric_text_change)
+        self.lyric_editor.bind('<<Modified>>', self._on_editor_modified)
         
         # Analysis and tools frame
         tools_frame = ttk.Frame(editor_frame)
@@ -155,6 +247,31 @@ class LyricLabTab:
                                command=self._export_lyrics)
         export_btn.pack(side=tk.RIGHT, padx=(5, 0))
     
+    def _on_editor_modified(self, event=None):
+        """Drop the cached snapshot and reset Tk's modified flag."""
+        self._lyrics_cache = None
+        self.lyric_editor.edit_modified(False)
+    
+    def _is_empty(self):
+        """O(1) emptiness test against Tk's B-tree, no buffer copy."""
+        return self.lyric_editor.index("end-1c") == "1.0"
+    
+    def _get_lyrics_cached(self):
+        """Return the editor text, copying out of Tk only after an edit."""
+        if self._lyrics_cache is None:
+            # "end-1c" stops before Tk's implicit trailing newline, so no
+            # strip() pass (and no second string allocation) is needed
+            self._lyrics_cache = self.lyric_editor.get("1.0", "end-1c")
+        return self._lyrics_cache
+    
+    def _set_status(self, text):
+        """Set the shared status bar text, caching the method lookup."""
+        if self._set_parent_status is None:
+            self._set_parent_status = getattr(self.parent, 'set_status', None)
+            if self._set_parent_status is None:
+                return
+        self._set_parent_status(text)
+    
     def _generate_lyrics(self):
         """Generate lyrics using AI."""
         prompt = self.lyric_prompt.get("1.0", tk.END).strip()
@@ -168,55 +285,43 @@ class LyricLabTab:
             return
         
         # Show progress
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("🎤 Generating lyrics...")
+        self._set_status("🎤 Generating lyrics...")
         
         def generate_worker():
             try:
                 style = self.lyric_style.get()
                 lyrics = self.ai_interface.generate_lyrics(prompt, style)
                 
-                # Update UI in main thread
-                self.parent.root.after(0, lambda: self.lyric_editor.delete("1.0", tk.END))
-                self.parent.root.after(0, lambda: self.lyric_editor.insert("1.0", lyrics))
+                # One event-loop hop for delete+insert+status: fewer
+                # scheduled callbacks and no half-updated paint in between
+                def apply(result=lyrics, style=style):
+                    self.lyric_editor.delete("1.0", tk.END)
+                    self.lyric_editor.insert("1.0", result)
+                    self._set_status(f"🎤 Lyrics generated in {style} style")
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.root.after(0, lambda: self.parent.status_var.set(f"🎤 Lyrics generated in {style} style"))
+                self.parent.root.after(0, apply)
                 
             except Exception as e:
                 error_msg = f"Failed to generate lyrics: {str(e)}"
                 self.parent.root.after(0, lambda: messagebox.showerror("Generation Error", error_msg))
         
-        threading.Thread(target=generate_worker, daemon=True).start()
+        self._executor.submit(generate_worker)
     
     def _analyze_lyrics(self):
         """Analyze current lyrics with AI."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics to analyze.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         if not self.ai_interface:
             messagebox.showwarning("AI Not Available", "AI interface not available.")
             return
         
         def analyze_worker():
             try:
-                analysis_prompt = f"""Provide a comprehensive analysis of these lyrics:
-
-{lyrics}
-
-Include:
-1. Rhyme scheme and patterns
-2. Flow and rhythm analysis
-3. Emotional content and themes
-4. Literary devices used
-5. Overall quality assessment
-6. Suggestions for improvement
-7. Musical style recommendations
-
-Be detailed and constructive."""
+                analysis_prompt = _ANALYSIS_PROMPT_TMPL.format(lyrics=lyrics)
                 
                 response = self.ai_interface.chat_response(analysis_prompt)
                 self.parent.root.after(0, lambda: self._show_analysis_result("🔍 Complete Lyric Analysis", response))
@@ -225,16 +330,16 @@ Be detailed and constructive."""
                 error_msg = f"Analysis failed: {str(e)}"
                 self.parent.root.after(0, lambda: messagebox.showerror("Analysis Error", error_msg))
         
-        threading.Thread(target=analyze_worker, daemon=True).start()
+        self._executor.submit(analyze_worker)
     
     def _generate_beat_from_lyrics(self):
         """Enhanced beat generation with better Beat Studio integration."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics first!")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         # Enhanced analysis dialog
         analysis_window = tk.Toplevel(self.parent.root)
         analysis_window.title("🎵 Generating Beat from Lyrics")
@@ -249,7 +354,6 @@ Be detailed and constructive."""
         ttk.Label(main_frame, text="🎵 Analyzing Lyrics for Beat Generation", 
              font=('Arial', 14, 'bold')).pack(pady=(0, 20))
     
-        from tkinter.scrolledtext import ScrolledText
         analysis_text = ScrolledText(main_frame, height=10, wrap=tk.WORD, font=('Arial', 10))
         analysis_text.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
     
@@ -288,23 +392,26 @@ Be detailed and constructive."""
         close_btn = ttk.Button(btn_frame, text="Close", command=analysis_window.destroy)
         close_btn.pack(side=tk.RIGHT)
     
-        # Enhanced analysis simulation
-        def simulate_analysis():
-            steps = [
-                (1000, "🎵 Determining musical style...", f"Analyzing lyrics for musical characteristics...\n\n"),
-                (2000, "🥁 Generating beat patterns...", f"Style detected: {self.lyric_style.get()}\nRecommended BPM: 120\nEnergy level: High\n\n"),
-                (3000, "✅ Beat generation complete!", "Beat pattern generated successfully!\nReady to open Beat Studio.\n"),
+        # Analysis simulation: one chained timer advances through the
+        # steps, so there is a single pending after() at any time instead
+        # of a callback pair per step
+        steps = [
+            (1000, "🎵 Determining musical style...", "Analyzing lyrics for musical characteristics...\n\n"),
+            (1000, "🥁 Generating beat patterns...", f"Style detected: {self.lyric_style.get()}\nRecommended BPM: 120\nEnergy level: High\n\n"),
+            (1000, "✅ Beat generation complete!", "Beat pattern generated successfully!\nReady to open Beat Studio.\n"),
         ]
         
-        for delay, status, text in steps:
-            analysis_window.after(delay, lambda s=status: status_var.set(s))
-            analysis_window.after(delay, lambda t=text: analysis_text.insert(tk.END, t))
-        
-        # Enable button when complete
-        analysis_window.after(3000, lambda: progress.stop())
-        analysis_window.after(3000, lambda: generate_btn.configure(state='normal'))
-    
-        simulate_analysis()
+        def run_step(i=0):
+            if i >= len(steps):
+                progress.stop()
+                generate_btn.configure(state='normal')
+                return
+            _, status, text = steps[i]
+            status_var.set(status)
+            analysis_text.insert(tk.END, text)
+            analysis_window.after(steps[i][0], run_step, i + 1)
+        
+        analysis_window.after(steps[0][0], run_step)
     
     # Replace the _open_beat_studio method in lyric_lab_tab.py with this enhanced version
     def _open_beat_studio(self):
@@ -335,8 +442,7 @@ Be detailed and constructive."""
                 menu_handlers._show_beat_studio()
                 
                 # Update status if available
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.status_var.set("🎵 Beat Studio opened from Lyric Lab!")
+                self._set_status("🎵 Beat Studio opened from Lyric Lab!")
                     
                 logger.info("✅ Beat Studio opened successfully from Lyric Lab")
             else:
@@ -372,72 +478,72 @@ Be detailed and constructive."""
     
     def _analyze_rhyme_scheme(self):
         """Analyze rhyme scheme with AI."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics to analyze.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         messagebox.showinfo("Rhyme Analysis", "🎭 Rhyme scheme analysis coming soon!\n\nThis will analyze:\n• Rhyme patterns\n• Internal rhymes\n• Slant rhymes")
     
     def _analyze_lyric_flow(self):
         """Analyze lyric flow and rhythm."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics to analyze.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         messagebox.showinfo("Flow Analysis", "🌊 Flow analysis coming soon!\n\nThis will analyze:\n• Syllable count\n• Rhythm patterns\n• Flow variations")
     
     def _analyze_lyric_sentiment(self):
         """Analyze sentiment and emotional content."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics to analyze.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         messagebox.showinfo("Sentiment Analysis", "💭 Sentiment analysis coming soon!\n\nThis will analyze:\n• Emotional tone\n• Mood progression\n• Emotional intensity")
     
     def _analyze_lyric_complexity(self):
         """Analyze lyrical complexity and sophistication."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics to analyze.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         messagebox.showinfo("Complexity Analysis", "🧠 Complexity analysis coming soon!\n\nThis will analyze:\n• Vocabulary sophistication\n• Literary devices\n• Narrative structure")
     
     def _suggest_chord_progression(self):
         """Suggest chord progression based on lyrics."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics first.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         messagebox.showinfo("Chord Suggestions", "🎼 Chord progression suggestions coming soon!\n\nThis will suggest:\n• Verse progressions\n• Chorus progressions\n• Key signatures")
     
     def _suggest_tempo(self):
         """Suggest tempo based on lyrics."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "Please enter some lyrics first.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         messagebox.showinfo("Tempo Suggestions", "⏱️ Tempo suggestions coming soon!\n\nThis will suggest:\n• Optimal BPM\n• Tempo reasoning\n• Alternative tempos")
     
     def _save_lyric_version(self):
         """Save current lyric version."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "No lyrics to save.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         file_path = filedialog.asksaveasfilename(
             title="Save Lyric Version",
             defaultextension=".txt",
@@ -450,14 +556,32 @@ Be detailed and constructive."""
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"CodedSwitch Lyric Lab - Saved Version\n")
-                    f.write("=" * 50 + "\n\n")
-                    f.write(f"Style: {self.lyric_style.get()}\n")
-                    f.write(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    f.write("LYRICS:\n")
-                    f.write("-" * 30 + "\n")
-                    f.write(lyrics)
+                if file_path.endswith('.json'):
+                    # Structured save: C-implemented encoder, and loads
+                    # back without re-parsing a text header
+                    payload = {
+                        "style": self.lyric_style.get(),
+                        "created": datetime.now().isoformat(),
+                        "lyrics": lyrics,
+                    }
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(payload, f, ensure_ascii=False)
+                    messagebox.showinfo("Saved", f"Lyrics saved to: {os.path.basename(file_path)}")
+                    return
+                
+                # One pre-formatted body and one write call: the OS sees a
+                # single buffered write instead of seven
+                body = (
+                    f"CodedSwitch Lyric Lab - Saved Version\n"
+                    f"{'=' * 50}\n\n"
+                    f"Style: {self.lyric_style.get()}\n"
+                    f"Created: {_timestamp()}\n\n"
+                    f"LYRICS:\n"
+                    f"{'-' * 30}\n"
+                    f"{lyrics}"
+                )
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.write(body)
                 
                 messagebox.showinfo("Saved", f"Lyrics saved to: {os.path.basename(file_path)}")
                 
@@ -477,8 +601,15 @@ Be detailed and constructive."""
         
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                if file_path.endswith('.json'):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    content = data.get("lyrics", "")
+                    if data.get("style") in self.LYRIC_STYLE_NAMES:
+                        self.lyric_style.set(data["style"])
+                else:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
                 
                 self.lyric_editor.delete("1.0", tk.END)
                 self.lyric_editor.insert("1.0", content)
@@ -490,12 +621,12 @@ Be detailed and constructive."""
     
     def _export_lyrics(self):
         """Export lyrics to various formats."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if not lyrics:
+        if self._is_empty():
             messagebox.showwarning("No Lyrics", "No lyrics to export.")
             return
         
+        lyrics = self._get_lyrics_cached()
+        
         file_path = filedialog.asksaveasfilename(
             title="Export Lyrics",
             defaultextension=".txt",
@@ -508,12 +639,26 @@ Be detailed and constructive."""
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Generated with CodedSwitch Lyric Lab\n")
-                    f.write(f"Style: {self.lyric_style.get()}\n")
-                    f.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-                    f.write("=" * 50 + "\n\n")
-                    f.write(lyrics)
+                if file_path.endswith('.json'):
+                    payload = {
+                        "style": self.lyric_style.get(),
+                        "exported": datetime.now().isoformat(),
+                        "lyrics": lyrics,
+                    }
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(payload, f, ensure_ascii=False)
+                    messagebox.showinfo("Exported", f"Lyrics exported to: {os.path.basename(file_path)}")
+                    return
+                
+                body = (
+                    f"Generated with CodedSwitch Lyric Lab\n"
+                    f"Style: {self.lyric_style.get()}\n"
+                    f"Exported: {_timestamp(seconds=False)}\n"
+                    f"{'=' * 50}\n\n"
+                    f"{lyrics}"
+                )
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.write(body)
                 
                 messagebox.showinfo("Exported", f"Lyrics exported to: {os.path.basename(file_path)}")
                 
@@ -523,8 +668,7 @@ Be detailed and constructive."""
     def _on_style_change(self, event=None):
         """Handle style selection change."""
         selected_style = self.lyric_style.get()
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set(f"🎵 Style changed to: {selected_style}")
+        self._set_status(f"🎵 Style changed to: {selected_style}")
     
     def _show_style_info(self):
         """Show information about lyric styles."""
@@ -539,34 +683,44 @@ Be detailed and constructive."""
         ttk.Label(main_frame, text="🎵 Available Lyric Styles", 
                  font=('Arial', 14, 'bold')).pack(pady=(0, 20))
         
-        from tkinter.scrolledtext import ScrolledText
-        info_text = ScrolledText(main_frame, wrap=tk.WORD, font=('Arial', 11))
-        info_text.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
-        
-        style_info = "LYRIC STYLE GUIDE\n" + "=" * 50 + "\n\n"
-        
-        for style, description in self.LYRIC_STYLES.items():
-            style_info += f"🎵 {style.upper()}\n"
-            style_info += f"   {description}\n\n"
-        
-        style_info += "\n💡 TIP: Choose the style that best matches your intended mood and message!"
-        
-        info_text.insert("1.0", style_info)
-        info_text.config(state='disabled')
+        if self._style_info_backing is None:
+            # Populated once; never packed - it just owns the buffer
+            self._style_info_backing = tk.Text(self.parent.root)
+            self._style_info_backing.insert("1.0", self._style_info_text)
+        
+        text_frame = ttk.Frame(main_frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+        info_text = _TextPeer(text_frame, self._style_info_backing,
+                              wrap=tk.WORD, font=('Arial', 11))
+        info_vsb = ttk.Scrollbar(text_frame, orient='vertical',
+                                 command=info_text.yview)
+        info_text.configure(yscrollcommand=info_vsb.set, state='disabled')
+        info_vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        info_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         ttk.Button(main_frame, text="Close", 
                   command=style_info_window.destroy).pack()
     
     def _on_lyric_text_change(self, event=None):
-        """Handle changes in the lyric editor."""
-        lyrics = self.lyric_editor.get("1.0", tk.END).strip()
-        
-        if lyrics and hasattr(self.parent, 'status_var'):
-            word_count = len(lyrics.split())
-            line_count = len([line for line in lyrics.split('\n') if line.strip()])
-            self.parent.status_var.set(f"📝 Words: {word_count} | Lines: {line_count}")
-        elif hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("Ready")
+        """Debounce editor changes so a burst of keystrokes counts once."""
+        if self._pending_recount_id is not None:
+            self.parent.root.after_cancel(self._pending_recount_id)
+        self._pending_recount_id = self.parent.root.after(120, self._recount)
+    
+    def _recount(self):
+        """Recount words and lines after edits settle."""
+        self._pending_recount_id = None
+        lyrics = self._get_lyrics_cached()
+        
+        if lyrics:
+            # finditer keeps the scan inside the regex engine without
+            # materializing a list of every word/line in the document
+            self._last_word_count = sum(1 for _ in _WORD_RE.finditer(lyrics))
+            self._last_line_count = sum(1 for _ in _NONEMPTY_LINE_RE.finditer(lyrics))
+            self._set_status(
+                f"📝 Words: {self._last_word_count} | Lines: {self._last_line_count}")
+        else:
+            self._set_status("Ready")
     
     def _show_analysis_result(self, title, result):
         """Show analysis result in a window."""
@@ -580,11 +734,28 @@ Be detailed and constructive."""
         
         ttk.Label(main_frame, text=title, font=('Arial', 14, 'bold')).pack(pady=(0, 20))
         
-        from tkinter.scrolledtext import ScrolledText
         result_text = ScrolledText(main_frame, wrap=tk.WORD, font=('Arial', 11))
         result_text.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
-        result_text.insert("1.0", result)
+        
+        # Render long responses lazily: only the first chunk is inserted up
+        # front, the rest streams in as the user scrolls toward the bottom
+        lines = result.splitlines(keepends=True)
+        chunks = iter("".join(lines[i:i + self._RESULT_CHUNK_LINES])
+                      for i in range(self._RESULT_CHUNK_LINES, len(lines),
+                                     self._RESULT_CHUNK_LINES))
+        result_text.insert("1.0", "".join(lines[:self._RESULT_CHUNK_LINES]))
         result_text.config(state='disabled')
         
+        def on_scroll(first, last):
+            result_text.vbar.set(first, last)
+            if float(last) > 0.8:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    result_text.config(state='normal')
+                    result_text.insert(tk.END, chunk)
+                    result_text.config(state='disabled')
+        
+        result_text.configure(yscrollcommand=on_scroll)
+        
         ttk.Button(main_frame, text="Close", 
                   command=result_window.destroy).pack()
\ No newline at end of file
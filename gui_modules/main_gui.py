@@ -7,14 +7,33 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import ttkbootstrap as ttk
-from ttkbootstrap import Style
+
+# Withdraw any default root a prior import created, before anything else
+# imported below can flash an unthemed window
+_root = getattr(tk, "_default_root", None)
+if _root:
+    _root.withdraw()
+
+from tkinter import messagebox
+import ttkbootstrap as tb
+import asyncio
+import importlib
 import logging
+import threading
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 
 
 logger = logging.getLogger(__name__)
 
+# Cold path: shown only when a tab module fails to import
+_ERROR_TEMPLATE = (
+    "❌ {name} Error\n\n"
+    "Could not load {name} module:\n"
+    "{err}\n\n"
+    "Please check the module file and dependencies."
+)
+
 class IntegratedTranslatorGUI:
     """Main GUI class with proper AI interface management"""
     
@@ -23,39 +42,72 @@ class IntegratedTranslatorGUI:
         self.ai_interface = ai_interface
         self.vulnerability_scanner = vulnerability_scanner
         
-        # Store reference for all components to access
-        self._ai_interface = ai_interface
+        # Asyncio loop that drives Tk; set in run(), used by tabs to
+        # schedule AI coroutines without blocking redraws
+        self.loop = None
+        self._running = False
+        
+        # Fixed after construction, so build the strings exactly once
+        ai_connected = bool(ai_interface)
+        self._ai_status_text = ("✅ CodedSwitch Ready - AI Connected" if ai_connected
+                                else "⚠️ CodedSwitch Ready - AI Not Available")
+        self._about_text = f"""CodedSwitch AI Code Translator
+Version: 2.0.0
+
+AI Status: {"✅ Connected" if ai_connected else "❌ Not Available"}
+
+Features:
+• Multi-language code translation
+• AI-powered chatbot assistance
+• Security vulnerability scanning
+• Creative lyric generation lab
+• Beat Studio for music production
+
+© 2024 CodedSwitch Team"""
         
         # Initialize GUI
         self.setup_gui()
         
         logger.info("GUI initialized with AI interface")
     
+    # (frame attr, tab label, name, module, class, component attr, kind);
+    # kind picks the second constructor argument in _build_tab
+    _TAB_SPEC = (
+        ("translator_tab", "🔄 Translator", "Translator",
+         "translator_tab", "TranslatorTab", "translator_tab_component", "ai"),
+        ("chatbot_tab", "🤖 AI Chatbot", "Chatbot",
+         "chatbot_tab", "ChatbotTab", "chatbot_tab_component", "ai"),
+        ("security_tab", "🔒 Security", "Security",
+         "security_tab", "SecurityTab", "security_tab_component", "scanner"),
+        ("lyric_tab", "🎤 Lyric Lab", "Lyric Lab",
+         "lyric_lab_tab", "LyricLabTab", "lyric_lab_tab_component", "ai"),
+    )
+    
     def get_ai_interface(self):
         """Provide AI interface access to other components"""
-        return getattr(self, 'ai_interface', None)
+        return self.ai_interface
     
     def setup_gui(self):
         """Set up the main GUI with proper error handling"""
         try:
-           
-            # Hide any default tkinter windows
-            import tkinter as tk
-            default_root = tk._default_root
-            if default_root:
-                default_root.withdraw()
-            
             # Create main window
-            self.root = ttk.Window(themename="superhero")
+            self.root = tb.Window(themename="superhero")
             self.root.title("CodedSwitch - AI Code Translator")
             self.root.geometry("1200x800")
             
+            # Start resolving tab modules off-thread while the window,
+            # menus and status bar build: .pyc stat/read I/O overlaps
+            # across workers and C-extension init releases the GIL
+            pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tab-import")
+            self._tab_module_futures = {
+                spec[3]: pool.submit(importlib.import_module, spec[3])
+                for spec in self._TAB_SPEC
+            }
+            pool.shutdown(wait=False)
+            
             # Create main interface
             self.setup_main_interface()
             
-            # Initialize menu handlers with AI reference
-            self.menu_handlers = self._init_menu_handlers()
-            
             # Setup menu bar
             self.setup_menu_bar()
             
@@ -65,17 +117,20 @@ class IntegratedTranslatorGUI:
             # Handle window closing
             self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
             
-            # Bind keyboard shortcuts
-            self.root.bind("<Control-n>", lambda event: self.menu_handlers._new_file())
-            self.root.bind("<Control-o>", lambda event: self.menu_handlers._open_file())
-            self.root.bind("<Control-s>", lambda event: self.menu_handlers._save_file())
+            # Bind keyboard shortcuts from one table; the default-arg
+            # capture keeps the menu_handlers lookup lazy per keypress
+            for seq, attr in (("<Control-n>", "_new_file"),
+                              ("<Control-o>", "_open_file"),
+                              ("<Control-s>", "_save_file")):
+                self.root.bind(seq, lambda e, a=attr: getattr(self.menu_handlers, a)())
             
         except Exception as e:
-            logger.error(f"Error setting up GUI: {e}")
+            logger.error("Error setting up GUI: %s", e)
             raise
     
-    def _init_menu_handlers(self):
-        """Initialize menu handlers with proper AI connection"""
+    @cached_property
+    def menu_handlers(self):
+        """Menu handlers, materialized on first use (lazy import)"""
         try:
             import menu_handlers
             # Pass self (the GUI instance) so menu handlers can access AI
@@ -87,11 +142,11 @@ class IntegratedTranslatorGUI:
     def setup_main_interface(self):
         """Set up the main interface with tabs"""
         # Create main container
-        self.main_container = ttk.Frame(self.root)
+        self.main_container = tb.Frame(self.root)
         self.main_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Create notebook for tabs
-        self.notebook = ttk.Notebook(self.main_container)
+        self.notebook = tb.Notebook(self.main_container)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
         # Create tabs with error handling
@@ -100,149 +155,152 @@ class IntegratedTranslatorGUI:
     def setup_tabs(self):
         """Set up all tabs with proper AI interface passing"""
         
-        # Translator Tab
-        self.translator_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.translator_tab, text="🔄 Translator")
-        try:
-            import translator_tab
-            self.translator_tab_component = translator_tab.TranslatorTab(self, self.ai_interface)
-        except Exception as e:
-            logger.error(f"Failed to create translator tab: {e}")
-            self._create_error_tab(self.translator_tab, "Translator", str(e))
-        
-        # Chatbot Tab
-        self.chatbot_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.chatbot_tab, text="🤖 AI Chatbot")
-        try:
-            import chatbot_tab
-            self.chatbot_tab_component = chatbot_tab.ChatbotTab(self, self.ai_interface)
-        except Exception as e:
-            logger.error(f"Failed to create chatbot tab: {e}")
-            self._create_error_tab(self.chatbot_tab, "Chatbot", str(e))
+        # Placeholder frames go in immediately so the window can paint;
+        # each tab's module import and component build is deferred to the
+        # first time that tab is actually selected
+        self._pending_tabs = {}
+        for index, spec in enumerate(self._TAB_SPEC):
+            frame = tb.Frame(self.notebook)
+            self.notebook.add(frame, text=spec[1])
+            setattr(self, spec[0], frame)
+            self._pending_tabs[index] = spec
         
-        # Security Tab
-        self.security_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.security_tab, text="🔒 Security")
-        try:
-            import security_tab
-            self.security_tab_component = security_tab.SecurityTab(self, self.vulnerability_scanner)
-        except Exception as e:
-            logger.error(f"Failed to create security tab: {e}")
-            self._create_error_tab(self.security_tab, "Security", str(e))
-        
-        # Lyric Lab Tab
-        self.lyric_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.lyric_tab, text="🎤 Lyric Lab")
+        self.notebook.bind("<<NotebookTabChanged>>", self._lazy_build_tab)
+        # The first tab is already selected, so build it right away
+        self._lazy_build_tab()
+    
+    def _lazy_build_tab(self, event=None):
+        """Build the selected tab's component on first visit"""
+        index = self.notebook.index(self.notebook.select())
+        spec = self._pending_tabs.pop(index, None)
+        if spec is not None:
+            self._build_tab(spec)
+    
+    def _build_tab(self, spec):
+        """Import one tab's module and instantiate its component"""
+        frame_attr, _, name, module_name, class_name, comp_attr, kind = spec
         try:
-            import lyric_lab_tab
-            self.lyric_lab_tab_component = lyric_lab_tab.LyricLabTab(self, self.ai_interface)
+            future = self._tab_module_futures.get(module_name)
+            if future is not None:
+                module = future.result()
+            else:
+                module = importlib.import_module(module_name)
+            arg = self.ai_interface if kind == "ai" else self.vulnerability_scanner
+            setattr(self, comp_attr, getattr(module, class_name)(self, arg))
         except Exception as e:
-            logger.error(f"Failed to create lyric lab tab: {e}")
-            self._create_error_tab(self.lyric_tab, "Lyric Lab", str(e))
+            logger.error("Failed to create %s tab: %s", name.lower(), e)
+            self._create_error_tab(getattr(self, frame_attr), name, str(e))
     
     def _create_error_tab(self, tab_frame, tab_name, error_msg):
         """Create an error display tab when module fails to load"""
-        error_frame = ttk.Frame(tab_frame)
+        error_frame = tb.Frame(tab_frame)
         error_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        ttk.Label(error_frame, text=f"❌ {tab_name} Error", 
-                 font=('Arial', 16, 'bold')).pack(pady=10)
-        
-        ttk.Label(error_frame, text=f"Could not load {tab_name} module:",
-                 font=('Arial', 12)).pack(pady=5)
-        
-        ttk.Label(error_frame, text=error_msg, 
-                 font=('Arial', 10), foreground="red").pack(pady=5)
-        
-        ttk.Label(error_frame, text="Please check the module file and dependencies.",
-                 font=('Arial', 10)).pack(pady=5)
+        tb.Label(error_frame,
+                 text=_ERROR_TEMPLATE.format(name=tab_name, err=error_msg),
+                 font=('Arial', 11), justify="left").pack(padx=20, pady=20)
+    
+    # (menu title, ((label, handler attr, accelerator) | None, ...));
+    # None is a separator, a "_self" suffix dispatches on the GUI itself
+    _MENU_SPEC = (
+        ("File", (("New", "_new_file", "Ctrl+N"),
+                  ("Open", "_open_file", "Ctrl+O"),
+                  ("Save", "_save_file", "Ctrl+S"),
+                  None,
+                  ("Exit", "_on_closing_self", None))),
+        ("Tools", (("🎵 Beat Studio", "_show_beat_studio", None),
+                   ("🎧 Audio Tools", "_show_audio_tools", None),
+                   ("⚙️ Preferences", "_show_preferences", None))),
+        ("Help", (("About", "_show_about_self", None),)),
+    )
     
     def setup_menu_bar(self):
-        """Set up the menu bar"""
-        if not self.menu_handlers:
-            return
-            
+        """Set up the menu bar from the declarative spec"""
         self.menubar = tk.Menu(self.root)
         self.root.config(menu=self.menubar)
         
-        # File menu
-        file_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="New", command=self.menu_handlers._new_file, accelerator="Ctrl+N")
-        file_menu.add_command(label="Open", command=self.menu_handlers._open_file, accelerator="Ctrl+O")
-        file_menu.add_command(label="Save", command=self.menu_handlers._save_file, accelerator="Ctrl+S")
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self._on_closing)
-        
-        # Tools menu
-        tools_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="🎵 Beat Studio", command=self.menu_handlers._show_beat_studio)
-        tools_menu.add_command(label="🎧 Audio Tools", command=self.menu_handlers._show_audio_tools)
-        tools_menu.add_command(label="⚙️ Preferences", command=self.menu_handlers._show_preferences)
-        
-        # Help menu
-        help_menu = tk.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self._show_about)
+        for title, items in self._MENU_SPEC:
+            menu = tk.Menu(self.menubar, tearoff=0)
+            self.menubar.add_cascade(label=title, menu=menu)
+            for item in items:
+                if item is None:
+                    menu.add_separator()
+                    continue
+                label, attr, accel = item
+                if attr.endswith("_self"):
+                    command = getattr(self, attr[:-5])
+                else:
+                    # Deferred dispatch keeps menu_handlers (and its
+                    # audio deps) unimported until an item is clicked
+                    command = lambda a=attr: getattr(self.menu_handlers, a)()
+                menu.add_command(label=label, command=command, accelerator=accel)
     
     def setup_status_bar(self):
         """Set up the status bar"""
-        self.status_frame = ttk.Frame(self.root)
+        self.status_frame = tb.Frame(self.root)
         self.status_frame.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Status variable
-        self.status_var = tk.StringVar()
-        if self.ai_interface:
-            self.status_var.set("✅ CodedSwitch Ready - AI Connected")
-        else:
-            self.status_var.set("⚠️ CodedSwitch Ready - AI Not Available")
-        
-        # Status label
-        self.status_label = ttk.Label(self.status_frame, textvariable=self.status_var,
+        # Plain text= label: a StringVar would add a Tcl variable trace
+        # for a value that updaters can set directly via set_status
+        self.status_label = tb.Label(self.status_frame, text=self._ai_status_text,
                                      relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2, pady=2)
     
+    def set_status(self, text):
+        """Update the status bar text"""
+        self.status_label.configure(text=text)
+    
     def _show_about(self):
         """Show about dialog"""
-        ai_status = "✅ Connected" if self.ai_interface else "❌ Not Available"
-        
-        about_text = f"""CodedSwitch AI Code Translator
-Version: 2.0.0
-
-AI Status: {ai_status}
-
-Features:
-• Multi-language code translation
-• AI-powered chatbot assistance
-• Security vulnerability scanning
-• Creative lyric generation lab
-• Beat Studio for music production
-
-© 2024 CodedSwitch Team"""
-        
-        messagebox.showinfo("About CodedSwitch", about_text)
+        messagebox.showinfo("About CodedSwitch", self._about_text)
     
     def _on_closing(self):
         """Handle application closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit CodedSwitch?"):
-            try:
-                # Cleanup if needed
-                if hasattr(self, 'menu_handlers') and hasattr(self.menu_handlers, 'beat_studio'):
-                    self.menu_handlers.beat_studio.stop_playback()
-            except:
-                pass
+            # __dict__ probe so a never-opened menu isn't imported just
+            # to be asked whether playback needs stopping
+            bs = getattr(self.__dict__.get('menu_handlers'), 'beat_studio', None)
+            if bs is not None:
+                # Audio backends can block in teardown mutexes; run the
+                # stop on a daemon thread and give it one second so the
+                # window always closes
+                stopper = threading.Thread(target=bs.stop_playback, daemon=True)
+                stopper.start()
+                stopper.join(timeout=1.0)
+                if stopper.is_alive():
+                    logger.warning("Playback teardown still running at close; not waiting")
             
-            self.root.quit()
+            self._running = False
             self.root.destroy()
     
+    async def _drive_tk(self):
+        """Pump Tk events from asyncio so tasks run between redraws"""
+        interval = tk._tkinter.getbusywaitinterval() / 1000
+        while self._running:
+            try:
+                self.root.update()
+            except tk.TclError:
+                # Window destroyed out from under us
+                break
+            await asyncio.sleep(interval)
+    
     def run(self):
         """Run the GUI application"""
         try:
             logger.info("Starting CodedSwitch GUI")
-            self.root.mainloop()
+            # Cooperative replacement for mainloop(): tabs can
+            # create_task AI coroutines on self.loop and the UI keeps
+            # redrawing every poll interval instead of blocking on I/O
+            self._running = True
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.loop.run_until_complete(self._drive_tk())
+            finally:
+                asyncio.set_event_loop(None)
+                self.loop.close()
         except Exception as e:
-            logger.error(f"Error running GUI: {e}")
+            logger.error("Error running GUI: %s", e)
             messagebox.showerror("Application Error", f"Application error: {e}")
         finally:
             logger.info("CodedSwitch GUI ended")
@@ -252,10 +310,16 @@ if __name__ == "__main__":
     import logging
     logging.basicConfig(level=logging.INFO)
     
-    # Test AI interface import
+    # Test AI interface import. LazyLoader defers exec_module until the
+    # first attribute access, so keyless smoke runs skip the Gemini SDK
     ai_interface = None
     try:
-        import integrated_ai
+        import importlib.util
+        spec = importlib.util.find_spec("integrated_ai")
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        integrated_ai = importlib.util.module_from_spec(spec)
+        sys.modules["integrated_ai"] = integrated_ai
+        spec.loader.exec_module(integrated_ai)
         api_key = os.getenv('GEMINI_API_KEY', 'test_key')
         if api_key and api_key != 'test_key':
             ai_interface = integrated_ai.IntegratedTranslatorAI(api_key=api_key)
@@ -32,8 +32,8 @@ class MenuHandlers:
             self.gui.target_code.delete("1.0", tk.END)
             
             logger.info("New file created (text areas cleared).")
-            if hasattr(self.gui, 'status_var'):
-                self.gui.status_var.set("Ready")
+            if hasattr(self.gui, 'set_status'):
+                self.gui.set_status("Ready")
         except AttributeError:
             logger.error("Could not find text widgets to clear.")
             messagebox.showerror("Error", "Could not clear text areas. Translator tab may not be loaded correctly.")
@@ -59,8 +59,8 @@ class MenuHandlers:
             self.gui.source_code.insert("1.0", content)
             
             logger.info(f"File opened: {filepath}")
-            if hasattr(self.gui, 'status_var'):
-                self.gui.status_var.set(f"Opened: {os.path.basename(filepath)}")
+            if hasattr(self.gui, 'set_status'):
+                self.gui.set_status(f"Opened: {os.path.basename(filepath)}")
                 
         except FileNotFoundError:
             messagebox.showerror("Error", "File not found.")
@@ -98,8 +98,8 @@ class MenuHandlers:
                 file.write(content)
             
             logger.info(f"File saved: {filepath}")
-            if hasattr(self.gui, 'status_var'):
-                self.gui.status_var.set(f"Saved: {os.path.basename(filepath)}")
+            if hasattr(self.gui, 'set_status'):
+                self.gui.set_status(f"Saved: {os.path.basename(filepath)}")
                 
         except AttributeError:
             logger.error("Could not find text widgets to save from.")
@@ -168,12 +168,12 @@ class MenuHandlers:
                 self.beat_studio = BeatStudioWindow(self.gui.root, ai_interface, self.professional_audio)
                 
                 # Update status based on available features
-                if hasattr(self.gui, 'status_var'):
+                if hasattr(self.gui, 'set_status'):
                     if ai_interface and self.professional_audio:
                         status_msg = "🎵 Enhanced Beat Studio opened with AI + Professional Audio!"
                     else:
                         status_msg = "🎵 Enhanced Beat Studio opened (some features may be limited)"
-                    self.gui.status_var.set(status_msg)
+                    self.gui.set_status(status_msg)
                 
                 logger.info("Enhanced Beat Studio opened successfully")
                 return True
@@ -219,6 +219,8 @@ class BeatStudioWindow:
         self.current_pattern = {}
         self.bpm = 120
         self.current_step = 0
+        # Last column painted with the playback highlight (-1 = none)
+        self._last_highlighted_step = -1
         self.pattern_length = 16
         self.tracks = ['Kick', 'Snare', 'Hi-Hat', 'Bass', 'Synth', 'Pad', 'Lead', 'FX']
         
@@ -584,20 +586,22 @@ class BeatStudioWindow:
 
     def highlight_current_step(self, step):
         """Highlight the current playback step"""
+        last = self._last_highlighted_step
+        if step == last:
+            return
+        default_pattern = [0] * self.pattern_length
         for track, buttons in self.pattern_buttons.items():
-            for i, btn in enumerate(buttons):
-                if i == step and step >= 0:
-                    # Highlight current step
-                    if self.current_pattern.get(track, [0] * self.pattern_length)[i]:
-                        btn.configure(bg='red')
-                    else:
-                        btn.configure(bg='yellow')
-                else:
-                    # Reset to normal color
-                    if self.current_pattern.get(track, [0] * self.pattern_length)[i]:
-                        btn.configure(bg='orange')
-                    else:
-                        btn.configure(bg='lightgray')
+            pattern = self.current_pattern.get(track, default_pattern)
+            # Repaint only the column leaving the highlight and the one
+            # entering it: two configures per track and tick instead of
+            # one per button
+            if 0 <= last < len(buttons):
+                buttons[last].configure(bg='orange' if pattern[last] else 'lightgray')
+            if 0 <= step < len(buttons):
+                buttons[step].configure(bg='red' if pattern[step] else 'yellow')
+        self._last_highlighted_step = step
+        # One explicit display flush for the whole diff
+        self.window.update_idletasks()
 
     def update_bpm(self):
         """Update BPM from spinbox"""
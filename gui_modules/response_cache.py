@@ -0,0 +1,124 @@
+"""
+Semantic Response Cache for CodedSwitch Application
+
+Short-circuits repeated AI prompts with a local LRU + TTL cache. When
+sentence-transformers is installed, lookups match near-duplicate prompts by
+cosine similarity of sentence embeddings; without it the cache degrades to
+exact matching on the normalized prompt text, so the optional dependency
+stays optional.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Safe imports
+try:
+    from .constants import Constants
+except ImportError:
+    try:
+        from constants import Constants
+    except ImportError:
+        class Constants:
+            CACHE_MAX_SIZE = 128
+            CACHE_TTL_SECONDS = 3600
+            CACHE_SIMILARITY_THRESHOLD = 0.90
+
+
+class ResponseCache:
+    """LRU + TTL cache for AI responses keyed by prompt similarity."""
+
+    _EMBED_MODEL = "all-MiniLM-L6-v2"
+
+    def __init__(self, max_size=None, ttl=None, threshold=None):
+        self.max_size = max_size or Constants.CACHE_MAX_SIZE
+        self.ttl = ttl or Constants.CACHE_TTL_SECONDS
+        self.threshold = threshold or Constants.CACHE_SIMILARITY_THRESHOLD
+        # key -> (embedding or None, response, timestamp)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._embedder = None
+        self._embedder_failed = False
+
+    def _embed(self, text):
+        """Return a normalized float32 embedding, or None when unavailable."""
+        if self._embedder_failed or np is None:
+            return None
+        if self._embedder is None:
+            try:
+                # Lazy-loaded once on first use - the model load is the
+                # expensive part, not the per-message encode
+                from sentence_transformers import SentenceTransformer
+                self._embedder = SentenceTransformer(self._EMBED_MODEL)
+            except Exception as e:
+                logger.info(f"Semantic cache falling back to exact matching: {e}")
+                self._embedder_failed = True
+                return None
+        vec = self._embedder.encode(text).astype(np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    @staticmethod
+    def _key(text):
+        return " ".join(text.lower().split())
+
+    def _purge_expired(self, now):
+        while self._entries:
+            key, (_, _, ts) = next(iter(self._entries.items()))
+            if now - ts <= self.ttl:
+                break
+            self._entries.popitem(last=False)
+
+    def get(self, message):
+        """Return a cached response for a similar prompt, or None."""
+        query = self._embed(message)
+        now = time.time()
+        with self._lock:
+            self._purge_expired(now)
+            if not self._entries:
+                return None
+            key = self._key(message)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[2] > self.ttl:
+                    # move_to_end on past hits keeps hot entries out of
+                    # _purge_expired's reach, so enforce the TTL here too
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+            if query is None:
+                return None
+            # One vectorized cosine-similarity pass over the live embeddings
+            keys = [k for k, v in self._entries.items()
+                    if v[0] is not None and now - v[2] <= self.ttl]
+            if not keys:
+                return None
+            matrix = np.stack([self._entries[k][0] for k in keys])
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                best_key = keys[best]
+                self._entries.move_to_end(best_key)
+                return self._entries[best_key][1]
+            return None
+
+    def put(self, message, response):
+        """Store a response, evicting the least recently used on overflow."""
+        embedding = self._embed(message)
+        with self._lock:
+            self._entries[self._key(message)] = (embedding, response, time.time())
+            self._entries.move_to_end(self._key(message))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
@@ -151,8 +151,8 @@ class SecurityTab:
             messagebox.showwarning("No Code", "Please enter code to scan.")
             return
         
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("🔍 Scanning for vulnerabilities...")
+        if hasattr(self.parent, 'set_status'):
+            self.parent.set_status("🔍 Scanning for vulnerabilities...")
         
         # Disable scan button during scanning
         scan_btn = ttk.Button(self.parent.security_tab, text="🔍 Scan Code", 
@@ -218,9 +218,9 @@ class SecurityTab:
                 # Update UI on main thread
                 self.parent.root.after(0, lambda: self._display_scan_results(vulnerabilities))
                 
-                if hasattr(self.parent, 'status_var'):
+                if hasattr(self.parent, 'set_status'):
                     status_msg = f"🔍 Scan complete: {len(vulnerabilities)} issues found"
-                    self.parent.root.after(0, lambda: self.parent.status_var.set(status_msg))
+                    self.parent.root.after(0, lambda: self.parent.set_status(status_msg))
                 
             except Exception as e:
                 error_msg = f"Security scan failed: {str(e)}"
@@ -336,8 +336,8 @@ class SecurityTab:
                 self.parent.security_code_input.delete("1.0", tk.END)
                 self.parent.security_code_input.insert("1.0", content)
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.status_var.set(f"📂 Loaded for scanning: {file_path}")
+                if hasattr(self.parent, 'set_status'):
+                    self.parent.set_status(f"📂 Loaded for scanning: {file_path}")
                 
                 logger.info(f"Loaded file for security scan: {file_path}")
                 
@@ -348,8 +348,8 @@ class SecurityTab:
         """Clear the code input area."""
         self.parent.security_code_input.delete("1.0", tk.END)
         
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("🗑️ Security scan input cleared")
+        if hasattr(self.parent, 'set_status'):
+            self.parent.set_status("🗑️ Security scan input cleared")
     
     def _clear_results(self):
         """Clear the scan results."""
@@ -359,8 +359,8 @@ class SecurityTab:
         
         self.scan_results.clear()
         
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("🗑️ Security scan results cleared")
+        if hasattr(self.parent, 'set_status'):
+            self.parent.set_status("🗑️ Security scan results cleared")
     
     @ErrorHandler.handle_error("Export Report")
     def export_report(self):
@@ -393,8 +393,8 @@ class SecurityTab:
                 
                 messagebox.showinfo("Export Complete", f"Security report exported to: {file_path}")
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.status_var.set(f"📤 Security report exported: {file_path}")
+                if hasattr(self.parent, 'set_status'):
+                    self.parent.set_status(f"📤 Security report exported: {file_path}")
                 
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export report: {str(e)}")
@@ -217,8 +217,8 @@ class TranslatorTab:
             return
         
         # Update status
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set(f"🔄 Translating {source_lang} to {target_lang}...")
+        if hasattr(self.parent, 'set_status'):
+            self.parent.set_status(f"🔄 Translating {source_lang} to {target_lang}...")
         
         # Disable button during translation
         self.translate_btn.config(state='disabled')
@@ -234,16 +234,16 @@ class TranslatorTab:
                 # Update UI on main thread
                 self.parent.root.after(0, lambda: self._display_translation_result(response))
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.root.after(0, lambda: self.parent.status_var.set("✅ Translation complete!"))
+                if hasattr(self.parent, 'set_status'):
+                    self.parent.root.after(0, lambda: self.parent.set_status("✅ Translation complete!"))
                 
             except Exception as e:
                 error_msg = f"Translation failed: {str(e)}"
                 self.parent.root.after(0, lambda: messagebox.showerror("Translation Error", error_msg))
                 logger.error(error_msg, exc_info=True)
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.root.after(0, lambda: self.parent.status_var.set("❌ Translation failed"))
+                if hasattr(self.parent, 'set_status'):
+                    self.parent.root.after(0, lambda: self.parent.set_status("❌ Translation failed"))
             finally:
                 # Re-enable button
                 self.parent.root.after(0, lambda: self.translate_btn.config(state='normal'))
@@ -265,8 +265,8 @@ class TranslatorTab:
         self.parent.source_code.delete("1.0", tk.END)
         self.parent.target_code.delete("1.0", tk.END)
         
-        if hasattr(self.parent, 'status_var'):
-            self.parent.status_var.set("🗑️ Code areas cleared")
+        if hasattr(self.parent, 'set_status'):
+            self.parent.set_status("🗑️ Code areas cleared")
     
     @ErrorHandler.handle_error("File Loading")
     def _load_file(self):
@@ -291,8 +291,8 @@ class TranslatorTab:
                 self.parent.source_code.delete("1.0", tk.END)
                 self.parent.source_code.insert("1.0", content)
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.status_var.set(f"📂 Loaded: {file_path}")
+                if hasattr(self.parent, 'set_status'):
+                    self.parent.set_status(f"📂 Loaded: {file_path}")
                 
                 logger.info(f"Loaded file: {file_path}")
                 
@@ -340,8 +340,8 @@ class TranslatorTab:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(translated_code)
                 
-                if hasattr(self.parent, 'status_var'):
-                    self.parent.status_var.set(f"💾 Saved: {file_path}")
+                if hasattr(self.parent, 'set_status'):
+                    self.parent.set_status(f"💾 Saved: {file_path}")
                 
                 logger.info(f"Saved translated code to: {file_path}")
                 messagebox.showinfo("File Saved", f"Code saved to: {file_path}")
@@ -189,6 +189,21 @@ class IntegratedTranslatorAI:
             logger.error(f"Error in chat response: {e}")
             return f"I'm sorry, I encountered an error: {e}"
             
+    def chat_response_stream(self, message: str):
+        """
+        Yields chat response text chunks as they stream from the model.
+        Falls back to a single error chunk on failure, mirroring chat_response.
+        """
+        logger.info(f"Streaming chat response for: '{message[:50]}...'")
+        try:
+            response = self.chat_session.send_message(message, stream=True)
+            for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            logger.error(f"Error in streaming chat response: {e}")
+            yield f"I'm sorry, I encountered an error: {e}"
+
     # Alias for backward compatibility
     def chat_with_ai(self, message: str, conversation_history: list = None) -> str:
         """